@@ -0,0 +1,49 @@
+"""
+asyncio.TaskGroup error handling helpers
+
+TaskGroup wraps child failures in an ExceptionGroup. Callers that predate
+it expect a single exception (e.g. an HTTPException carrying a status
+code), so the group is unwrapped here in one place.
+"""
+
+import logging
+from typing import Iterator, NoReturn, Tuple, Type, Union
+
+logger = logging.getLogger(__name__)
+
+
+def _leaf_exceptions(group: BaseExceptionGroup) -> Iterator[BaseException]:
+    """Exceptions in a (possibly nested) exception group, in order"""
+    for exc in group.exceptions:
+        if isinstance(exc, BaseExceptionGroup):
+            yield from _leaf_exceptions(exc)
+        else:
+            yield exc
+
+
+def raise_from_group(
+    group: BaseExceptionGroup,
+    prefer: Union[Type[BaseException], Tuple[Type[BaseException], ...]] = ()
+) -> NoReturn:
+    """
+    Re-raise a single failure from a TaskGroup's exception group
+
+    The first exception matching `prefer` is raised, otherwise the first
+    failure. Every other failure is logged with its traceback, and the
+    group is chained as __cause__ so its traceback is kept too.
+
+    Args:
+        group: Exception group raised by asyncio.TaskGroup
+        prefer: Exception type(s) to raise ahead of the others
+    """
+    preferred, rest = group.split(prefer) if prefer else (None, group)
+    failures = []
+    if preferred is not None:
+        failures.extend(_leaf_exceptions(preferred))
+    if rest is not None:
+        failures.extend(_leaf_exceptions(rest))
+
+    first, *others = failures
+    for exc in others:
+        logger.error(f"Concurrent task also failed: {exc!r}", exc_info=exc)
+    raise first from group
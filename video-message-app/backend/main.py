@@ -165,6 +165,8 @@ async def shutdown_event():
     log_info("Shutting down services...")
     await progress_tracker.stop()
     log_info("Progress tracker stopped")
+    await voice.voice_manager.flush()
+    log_info("Voice metadata flushed")
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=55433)
\ No newline at end of file
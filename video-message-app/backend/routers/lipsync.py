@@ -4,9 +4,11 @@ MuseTalk/EchoMimicを使用したリップシンク動画生成
 """
 
 import os
+import asyncio
 import hashlib
 from pathlib import Path
 
+import aiofiles
 from fastapi import APIRouter, HTTPException, UploadFile, File
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
@@ -14,6 +16,7 @@ from typing import Optional, Tuple
 import logging
 
 from core.config import settings
+from core.task_group import raise_from_group
 from security.image_validator import ImageSecurityValidator
 from security.audio_validator import AudioValidator
 
@@ -238,6 +241,48 @@ async def _apply_blink_postprocessing(result: dict, audio_path: Path) -> dict:
         return result
 
 
+async def _prepare_lipsync_inputs(request: "VideoGenerationRequest") -> Tuple[Path, Path, bytes, bytes]:
+    """
+    Resolve, read and preprocess the audio/image inputs for lip-sync generation.
+
+    Independent of engine selection, so generate_video runs it concurrently
+    with the engine health checks.
+
+    Returns:
+        Tuple of (audio_path, image_path, audio_data, image_data)
+
+    Raises:
+        HTTPException: If either storage path is invalid
+    """
+    # Read uploaded files from shared Docker volume (with size limits)
+    try:
+        audio_path = _resolve_storage_path(request.audio_url, max_size_bytes=MAX_AUDIO_SIZE_BYTES)
+        image_path = _resolve_storage_path(request.source_url, max_size_bytes=MAX_IMAGE_SIZE_BYTES)
+    except (ValueError, FileNotFoundError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Read off the event loop so concurrent pipelines keep polling/progress alive
+    async with aiofiles.open(audio_path, 'rb') as f:
+        audio_data = await f.read()
+    async with aiofiles.open(image_path, 'rb') as f:
+        image_data = await f.read()
+
+    # Smart upper-body crop for optimal MuseTalk/EchoMimic/LivePortrait input
+    if settings.upper_body_crop_enabled:
+        from services.upper_body_cropper import get_upper_body_cropper
+        cropper = get_upper_body_cropper(
+            target_size=settings.upper_body_crop_target_size,
+            face_ratio=settings.upper_body_crop_face_ratio,
+        )
+        try:
+            image_data, crop_metadata = await cropper.crop_upper_body(image_data)
+            logger.info(f"Upper-body crop: {crop_metadata}")
+        except Exception as e:
+            logger.warning(f"Upper-body crop failed, using original image: {e}")
+
+    return audio_path, image_path, audio_data, image_data
+
+
 async def _save_to_storage(data: bytes, filename: str, subdir: str = "uploads") -> str:
     """Save file directly to shared storage volume and return storage URL."""
     ext = Path(filename).suffix.lower() or '.bin'
@@ -280,32 +325,19 @@ async def generate_video(request: VideoGenerationRequest):
         生成された動画の情報
     """
     try:
-        # Select the appropriate lip-sync engine
-        engine_name, client = await _select_lipsync_engine()
-        logger.info(f"Using lip-sync engine: {engine_name}")
-
-        # Read uploaded files from shared Docker volume (with size limits)
+        # Engine health checks (network) and input preparation (file I/O + crop)
+        # are independent, so run them concurrently. TaskGroup cancels the other
+        # half as soon as one fails or the request is cancelled.
         try:
-            audio_path = _resolve_storage_path(request.audio_url, max_size_bytes=MAX_AUDIO_SIZE_BYTES)
-            image_path = _resolve_storage_path(request.source_url, max_size_bytes=MAX_IMAGE_SIZE_BYTES)
-        except (ValueError, FileNotFoundError) as e:
-            raise HTTPException(status_code=400, detail=str(e))
-
-        audio_data = audio_path.read_bytes()
-        image_data = image_path.read_bytes()
-
-        # Smart upper-body crop for optimal MuseTalk/EchoMimic/LivePortrait input
-        if settings.upper_body_crop_enabled:
-            from services.upper_body_cropper import get_upper_body_cropper
-            cropper = get_upper_body_cropper(
-                target_size=settings.upper_body_crop_target_size,
-                face_ratio=settings.upper_body_crop_face_ratio,
-            )
-            try:
-                image_data, crop_metadata = await cropper.crop_upper_body(image_data)
-                logger.info(f"Upper-body crop: {crop_metadata}")
-            except Exception as e:
-                logger.warning(f"Upper-body crop failed, using original image: {e}")
+            async with asyncio.TaskGroup() as tg:
+                engine_task = tg.create_task(_select_lipsync_engine())
+                inputs_task = tg.create_task(_prepare_lipsync_inputs(request))
+        except ExceptionGroup as eg:
+            # Keep the status code of an HTTPException raised by either half
+            raise_from_group(eg, prefer=HTTPException)
+        engine_name, client = engine_task.result()
+        audio_path, image_path, audio_data, image_data = inputs_task.result()
+        logger.info(f"Using lip-sync engine: {engine_name}")
 
         logger.info(
             f"{engine_name}動画生成開始: audio={audio_path.name} ({len(audio_data)} bytes), "
@@ -319,15 +319,16 @@ async def extract_selected_person(
                             from io import BytesIO
 
                             # Convert numpy arrays to bytes for inpainting service
+                            # (transient buffers: fast zlib level is enough)
                             pil_rembg = Image.fromarray(person_rgba)
                             rembg_buffer = BytesIO()
-                            pil_rembg.save(rembg_buffer, format='PNG')
+                            pil_rembg.save(rembg_buffer, format='PNG', compress_level=1)
                             rembg_bytes = rembg_buffer.getvalue()
 
                             # Original region for reference
                             pil_original = Image.fromarray(cv2.cvtColor(person_region, cv2.COLOR_BGR2RGB))
                             original_buffer = BytesIO()
-                            pil_original.save(original_buffer, format='PNG')
+                            pil_original.save(original_buffer, format='PNG', compress_level=1)
                             original_bytes = original_buffer.getvalue()
 
                             # Person bbox within the cropped region
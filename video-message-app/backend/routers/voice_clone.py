@@ -11,7 +11,6 @@ import tempfile
 import asyncio
 from pathlib import Path
 import aiofiles
-import json
 import uuid
 from datetime import datetime
 import os
@@ -549,18 +548,11 @@ async def test_voice_profile(
     try:
         logger.info(f"音声プロファイルテスト開始: {profile_id}")
         
-        # voices_metadata.jsonから直接プロファイル取得
-        metadata_path = Path("/app/storage/voices/voices_metadata.json")
-        
-        if not metadata_path.exists():
-            logger.error("voices_metadata.jsonが見つかりません")
-            raise HTTPException(status_code=500, detail="音声メタデータファイルが見つかりません")
-        
-        async with aiofiles.open(metadata_path, 'r', encoding='utf-8') as f:
-            content = await f.read()
-            metadata = json.loads(content)
+        # メタデータ（スナップショット + ジャーナル）からプロファイル取得
+        from services.voice_storage_service import VoiceStorageService
+        storage_service = VoiceStorageService()
         
-        profile = metadata.get('profiles', {}).get(profile_id)
+        profile = storage_service.get_profile(profile_id)
         
         if not profile:
             logger.error(f"プロファイルが見つかりません: {profile_id}")
@@ -570,7 +562,7 @@ async def test_voice_profile(
             )
         
         # プロファイルにIDを追加（synthesize_with_cloneで必要）
-        profile['id'] = profile_id
+        profile = {**profile, 'id': profile_id}
         
         logger.info(f"プロファイル取得成功: {profile.get('name')} (ID: {profile_id}, 参照音声: {profile.get('reference_audio_path')})")
         
@@ -8,7 +8,6 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import asyncio
 import tempfile
-import os
 from pathlib import Path
 
 from services.voicevox_client import (
@@ -173,21 +172,15 @@ async def batch_synthesize_speech(request: BatchSynthesisRequest):
                 'volume_scale': request.volume_scale
             }
             
-            audio_results = await client.batch_synthesis(
+            # 一時ディレクトリに音声ファイルを直接保存（失敗したテキストは除外）
+            temp_dir = tempfile.mkdtemp()
+            results = await client.batch_synthesis_to_files(
                 texts=request.texts,
+                output_dir=temp_dir,
                 speaker_id=request.speaker_id,
                 **params
             )
-            
-            # 一時ディレクトリに音声ファイルを保存
-            temp_dir = tempfile.mkdtemp()
-            file_paths = []
-            
-            for i, audio_data in enumerate(audio_results):
-                if audio_data:  # 空でない場合のみ保存
-                    file_path = os.path.join(temp_dir, f"speech_{i:03d}.wav")
-                    await client.save_audio(audio_data, file_path)
-                    file_paths.append(file_path)
+            file_paths = [path for path in results if path]
             
             return {
                 "message": f"{len(file_paths)}個の音声ファイルを生成しました",
@@ -3,19 +3,26 @@
 背景削除、背景合成、品質向上などの機能を提供
 """
 import asyncio
+import hashlib
 import io
+from collections import OrderedDict
 from typing import Optional, Tuple
-from PIL import Image, ImageEnhance, ImageFilter
+from PIL import Image, ImageEnhance, ImageFilter, ImageOps
 import numpy as np
 import rembg
 
 
 class ImageProcessor:
     """画像処理サービスクラス"""
+
+    # 背景削除結果キャッシュの最大エントリ数（同一写真での複数テイク向け）
+    BG_CACHE_MAX_ENTRIES = 32
     
     def __init__(self):
         """初期化"""
         self.session = rembg.new_session('u2net')
+        # 切り出し画像のSHA-256 -> 背景削除結果 (LRU)
+        self._bg_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
     
     def validate_image(self, image_bytes: bytes) -> Tuple[bool, str]:
         """
@@ -138,7 +145,21 @@ class ImageProcessor:
         Returns:
             背景削除後のnumpy配列 (BGRA)
         """
-        return rembg.remove(
+        # 同一ピクセル・同一パラメータなら推論をスキップ
+        hasher = hashlib.sha256(np.ascontiguousarray(image_array).tobytes())
+        hasher.update(repr((
+            image_array.shape, image_array.dtype.str, alpha_matting,
+            alpha_matting_foreground_threshold, alpha_matting_background_threshold,
+            alpha_matting_erode_size, post_process_mask,
+        )).encode())
+        key = hasher.hexdigest()
+
+        cached = self._bg_cache.get(key)
+        if cached is not None:
+            self._bg_cache.move_to_end(key)
+            return cached.copy()
+
+        result = rembg.remove(
             image_array,
             session=self.session,
             alpha_matting=alpha_matting,
@@ -147,6 +168,11 @@ class ImageProcessor:
             alpha_matting_erode_size=alpha_matting_erode_size,
             post_process_mask=post_process_mask,
         )
+
+        self._bg_cache[key] = result.copy()
+        if len(self._bg_cache) > self.BG_CACHE_MAX_ENTRIES:
+            self._bg_cache.popitem(last=False)
+        return result
     
     async def composite_background(self, subject_bytes: bytes, background_bytes: bytes) -> bytes:
         """
@@ -170,7 +196,12 @@ class ImageProcessor:
     def _composite_background_sync(self, subject_bytes: bytes, background_bytes: bytes) -> bytes:
         """背景合成の同期実行部分"""
         # 被写体画像を読み込み
-        subject = Image.open(io.BytesIO(subject_bytes)).convert("RGBA")
+        subject = Image.open(io.BytesIO(subject_bytes))
+        return self._encode_jpeg(self._composite_image(subject, background_bytes))
+
+    def _composite_image(self, subject: Image.Image, background_bytes: bytes) -> Image.Image:
+        """被写体（PIL画像）と背景を合成する"""
+        subject = subject.convert("RGBA")
         
         # 背景画像を読み込み
         background = Image.open(io.BytesIO(background_bytes)).convert("RGB")
@@ -183,11 +214,13 @@ class ImageProcessor:
         composite = Image.alpha_composite(background, subject)
         
         # RGBに変換して出力
-        final_image = composite.convert("RGB")
-        
-        # バイナリとして保存
+        return composite.convert("RGB")
+
+    @staticmethod
+    def _encode_jpeg(image: Image.Image) -> bytes:
+        """最終出力をJPEGとしてエンコード"""
         output_buffer = io.BytesIO()
-        final_image.save(output_buffer, format="JPEG", quality=95)
+        image.save(output_buffer, format="JPEG", quality=95)
         return output_buffer.getvalue()
     
     async def _enhance_edges(self, image_bytes: bytes) -> bytes:
@@ -210,23 +243,27 @@ class ImageProcessor:
     
     def _enhance_edges_sync(self, image_bytes: bytes) -> bytes:
         """エッジ強化の同期実行部分"""
-        image = Image.open(io.BytesIO(image_bytes))
-        
-        # シャープネス強化
-        enhancer = ImageEnhance.Sharpness(image)
-        image = enhancer.enhance(1.2)
-        
-        # 軽微なノイズ除去
-        image = image.filter(ImageFilter.MedianFilter(size=3))
+        image = self._enhance_edges_image(Image.open(io.BytesIO(image_bytes)))
         
         # バイナリとして保存
         output_buffer = io.BytesIO()
         if image.mode == "RGBA":
-            image.save(output_buffer, format="PNG")
+            # 中間データのため圧縮レベルを下げてエンコード時間を短縮
+            image.save(output_buffer, format="PNG", compress_level=1)
         else:
             image.save(output_buffer, format="JPEG", quality=95)
         
         return output_buffer.getvalue()
+
+    @staticmethod
+    def _enhance_edges_image(image: Image.Image) -> Image.Image:
+        """PIL画像に対するエッジ強化（シャープネス + ノイズ除去）"""
+        # シャープネス強化
+        enhancer = ImageEnhance.Sharpness(image)
+        image = enhancer.enhance(1.2)
+        
+        # 軽微なノイズ除去
+        return image.filter(ImageFilter.MedianFilter(size=3))
     
     async def process_for_lipsync(self, image_bytes: bytes, background_bytes: Optional[bytes] = None, enhance_quality: bool = True) -> bytes:
         """
@@ -240,39 +277,54 @@ class ImageProcessor:
         Returns:
             処理済み画像のバイナリデータ
         """
-        # Step 1: 背景削除
-        subject_bytes = await self.remove_background(image_bytes)
+        # 全ステップを1回のスレッド実行にまとめ、中間PNGのエンコード/デコードを省く
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(
+            None,
+            self._process_for_lipsync_sync,
+            image_bytes, background_bytes, enhance_quality
+        )
+        return result
+
+    def _process_for_lipsync_sync(
+        self,
+        image_bytes: bytes,
+        background_bytes: Optional[bytes],
+        enhance_quality: bool
+    ) -> bytes:
+        """リップシンク用パイプラインの同期実行部分（RGBAをメモリ上に保持）"""
+        # Step 1: 背景削除（remove_background_regionのキャッシュを共有し、rembg既定のパラメータで実行）
+        # 配列化でEXIFが失われるため、rembgと同様に向きを先に補正する
+        image = ImageOps.exif_transpose(Image.open(io.BytesIO(image_bytes)))
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        subject = Image.fromarray(self.remove_background_region(
+            np.asarray(image.convert("RGBA" if has_alpha else "RGB")),
+            alpha_matting=False,
+            post_process_mask=False,
+        ))
         
         # Step 2: 品質向上（オプション）
         if enhance_quality:
-            subject_bytes = await self._enhance_edges(subject_bytes)
+            subject = self._enhance_edges_image(subject)
         
         # Step 3: 背景合成（背景が提供された場合）
         if background_bytes:
-            final_bytes = await self.composite_background(subject_bytes, background_bytes)
-            return final_bytes
-        else:
-            # 背景削除のみの場合、透明部分を白で塗りつぶし
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self._add_white_background,
-                subject_bytes
-            )
-            return result
+            return self._encode_jpeg(self._composite_image(subject, background_bytes))
+
+        # 背景削除のみの場合、透明部分を白で塗りつぶし
+        return self._encode_jpeg(self._flatten_on_white(subject))
     
     def _add_white_background(self, image_bytes: bytes) -> bytes:
         """透明背景を白背景に変換"""
-        image = Image.open(io.BytesIO(image_bytes))
-        
+        return self._encode_jpeg(self._flatten_on_white(Image.open(io.BytesIO(image_bytes))))
+
+    @staticmethod
+    def _flatten_on_white(image: Image.Image) -> Image.Image:
+        """透明部分を白で塗りつぶしたPIL画像を返す"""
         if image.mode == "RGBA":
             # 白背景を作成
             background = Image.new("RGB", image.size, (255, 255, 255))
             # アルファチャンネルを使用して合成
             background.paste(image, mask=image.split()[-1])  # アルファチャンネルをマスクとして使用
             image = background
-        
-        # JPEG形式で保存
-        output_buffer = io.BytesIO()
-        image.save(output_buffer, format="JPEG", quality=95)
-        return output_buffer.getvalue()
\ No newline at end of file
+        return image
@@ -208,7 +208,7 @@ class InpaintingService:
             # Convert mask to bytes
             mask_img = Image.fromarray(damage_mask)
             mask_buffer = BytesIO()
-            mask_img.save(mask_buffer, format='PNG')
+            mask_img.save(mask_buffer, format='PNG', compress_level=1)
             mask_bytes = mask_buffer.getvalue()
 
             return is_damaged, mask_bytes, stats
@@ -280,7 +280,7 @@ class InpaintingService:
 
             # Save to bytes
             output_buffer = BytesIO()
-            result.save(output_buffer, format='PNG')
+            result.save(output_buffer, format='PNG', compress_level=1)
 
             logger.info("LaMa inpainting completed successfully")
             return output_buffer.getvalue()
@@ -324,7 +324,7 @@ class InpaintingService:
                 # Resize original to match rembg output (which may be cropped)
                 orig_resized = orig_img.convert('RGB').resize(rembg_img.size, Image.LANCZOS)
                 buf = BytesIO()
-                orig_resized.save(buf, format='PNG')
+                orig_resized.save(buf, format='PNG', compress_level=1)
                 original_image = buf.getvalue()
                 logger.info(f"Resized original {orig_img.size} to match rembg output {rembg_img.size}")
 
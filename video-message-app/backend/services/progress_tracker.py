@@ -8,16 +8,32 @@ Supports:
 - Multi-subscriber support (one task, many clients)
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, Set, Optional, AsyncIterator
+from datetime import datetime, timezone
+from typing import Dict, Set, Optional, AsyncIterator, Iterable, Sequence, Tuple
 from enum import Enum
 import asyncio
 import json
 import logging
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Maximum events kept per task; older events are evicted as new ones arrive
+HISTORY_CAP = 1000
+
+
+def _json_loads(data: bytes) -> Dict:
+    """Parse JSON bytes (stdlib json when orjson is not installed)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 
 # ============================================================================
 # Progress Event Types
@@ -38,22 +54,74 @@ class ProgressEvent:
     task_id: str
     event_type: EventType
     data: Dict
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    # Wall-clock creation time (epoch seconds); the datetime view is built
+    # only when serialized, not on every publish
+    created_at: float = field(default_factory=time.time)
+    # Monotonic creation time for in-process latency measurement (not serialized)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns, repr=False, compare=False)
+    # Already-encoded JSON for data, embedded verbatim by to_json
+    data_json: Optional[str] = field(default=None, repr=False, compare=False)
+    # to_json result, shared by every subscriber the event is sent to
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a naive UTC datetime"""
+        return datetime.fromtimestamp(self.created_at, timezone.utc).replace(tzinfo=None)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        self.created_at = value.timestamp()
+        self._json = None
 
     def to_json(self) -> str:
-        """Convert to JSON string"""
-        return json.dumps({
-            "task_id": self.task_id,
-            "event_type": self.event_type.value,
-            "data": self.data,
-            "timestamp": self.timestamp.isoformat()
-        })
+        """Convert to JSON string (encoded once, then cached)"""
+        if self._json is None:
+            if self.data_json is None:
+                self._json = json.dumps({
+                    "task_id": self.task_id,
+                    "event_type": self.event_type.value,
+                    "data": self.data,
+                    "timestamp": self.timestamp.isoformat()
+                })
+            else:
+                self._json = (
+                    f'{{"task_id": {json.dumps(self.task_id)}, '
+                    f'"event_type": "{self.event_type.value}", '
+                    f'"data": {self.data_json}, '
+                    f'"timestamp": "{self.timestamp.isoformat()}"}}'
+                )
+        return self._json
 
     def to_sse(self) -> str:
         """Convert to SSE format"""
         return f"data: {self.to_json()}\n\n"
 
 
+class SubscriberLease:
+    """
+    Pooled subscriber queue handed out by ProgressTracker.lease_subscriber
+
+    Unlike subscribe(), a lease does not replay history or send heartbeats;
+    it receives events published after it was leased.
+    """
+
+    __slots__ = ("task_id", "queue", "_tracker")
+
+    def __init__(self, tracker: "ProgressTracker", task_id: str, queue: asyncio.Queue):
+        self._tracker = tracker
+        self.task_id = task_id
+        self.queue = queue
+
+    async def get(self) -> ProgressEvent:
+        """Wait for the next event"""
+        event = await self.queue.get()
+        self._tracker._add_inflight(self.task_id, -1)
+        return event
+
+
 # ============================================================================
 # Progress Tracker Service
 # ============================================================================
@@ -66,26 +134,47 @@ class ProgressTracker:
     - Multi-subscriber support: Multiple clients can subscribe to same task
     - Automatic cleanup: Old progress data removed after retention period
     - Heartbeat: Periodic keepalive messages to detect disconnections
-    - Thread-safe: Async-safe operations with locks
+    - Bounded history: Per-task ring buffer (history_cap events)
+    - Async-safe without locks: state is only touched on the event loop
+      thread, and no mutation of history or subscribers spans an await
     """
 
-    def __init__(self, retention_minutes: int = 60):
-        # Progress data storage: task_id -> List[ProgressEvent]
-        self._progress_history: Dict[str, list[ProgressEvent]] = {}
+    def __init__(
+        self,
+        retention_minutes: int = 60,
+        subscriber_buffer: int = 1024,
+        history_cap: int = HISTORY_CAP
+    ):
+        # Progress data storage: task_id -> ring buffer of ProgressEvent
+        self._progress_history: Dict[str, deque[ProgressEvent]] = {}
+        self.history_cap = history_cap
 
         # Active subscribers: task_id -> Set[asyncio.Queue]
         self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
 
-        # Locks for thread-safety
-        self._lock = asyncio.Lock()
-
         # Retention policy
         self.retention_minutes = retention_minutes
 
+        # Default per-subscriber queue size. A subscriber whose queue fills up
+        # is disconnected, so this must absorb the largest expected burst
+        self.subscriber_buffer = subscriber_buffer
+
         # Background cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
 
-        logger.info(f"ProgressTracker initialized: retention={retention_minutes}min")
+        # Events queued to subscribers but not yet consumed: task_id -> count
+        self._inflight: Dict[str, int] = {}
+
+        # Set once a task has no undelivered events (awaited by drain)
+        self._drained: Dict[str, asyncio.Event] = {}
+
+        # Idle subscriber queues returned by release_subscriber, reused by lease_subscriber
+        self._sub_pool: list[asyncio.Queue] = []
+
+        logger.info(
+            f"ProgressTracker initialized: retention={retention_minutes}min, "
+            f"subscriber_buffer={subscriber_buffer}"
+        )
 
     async def start(self):
         """Start background tasks"""
@@ -118,58 +207,273 @@ class ProgressTracker:
             data=data
         )
 
-        async with self._lock:
-            # Store in history
-            if task_id not in self._progress_history:
-                self._progress_history[task_id] = []
-            self._progress_history[task_id].append(event)
+        self._history(task_id).append(event)
 
-            # Broadcast to all subscribers
-            if task_id in self._subscribers:
-                dead_queues = set()
-                for queue in self._subscribers[task_id]:
-                    try:
-                        queue.put_nowait(event)
-                    except asyncio.QueueFull:
-                        logger.warning(f"Subscriber queue full for task {task_id}, marking for removal")
-                        dead_queues.add(queue)
-                    except Exception as e:
-                        logger.error(f"Failed to publish to subscriber: {e}")
-                        dead_queues.add(queue)
-
-                # Remove dead queues
-                for queue in dead_queues:
-                    self._subscribers[task_id].discard(queue)
-
-        logger.debug(f"Published {event_type.value} event for task {task_id}")
-
-    async def subscribe(self, task_id: str, queue_size: int = 100) -> AsyncIterator[ProgressEvent]:
+        # Broadcast to all subscribers
+        self._broadcast(task_id, (event,))
+
+        # Lazy %-formatting: the hot path pays nothing when debug logging is off
+        logger.debug("Published %s event for task %s", event_type.value, task_id)
+
+    async def publish_events_batch(
+        self,
+        task_id: str,
+        items: Iterable[Tuple[EventType, Dict]]
+    ) -> None:
+        """
+        Publish several progress events for one task in one step
+
+        Equivalent to calling publish_event for each item in order, but
+        history is extended once and each subscriber queue is filled in a
+        single pass.
+
+        Args:
+            task_id: Task identifier
+            items: (event_type, data) pairs in publish order
+        """
+        events = [
+            ProgressEvent(task_id=task_id, event_type=event_type, data=data)
+            for event_type, data in items
+        ]
+        if not events:
+            return
+
+        self._history(task_id).extend(events)
+        self._broadcast(task_id, events)
+
+        logger.debug("Published %d events for task %s", len(events), task_id)
+
+    async def publish_event_preencoded(
+        self,
+        task_id: str,
+        event_type: EventType,
+        payload: bytes
+    ) -> None:
+        """
+        Publish a progress event whose payload is already JSON-encoded
+
+        The payload bytes are embedded verbatim when the event is serialized
+        for WebSocket/SSE delivery, so publishers that reuse payloads (e.g.
+        one blob per progress value) skip encoding entirely. event.data is
+        still available, parsed from the payload.
+
+        Args:
+            task_id: Task identifier
+            event_type: Type of event
+            payload: JSON object encoded as UTF-8 bytes
+        """
+        event = ProgressEvent(
+            task_id=task_id,
+            event_type=event_type,
+            data=_json_loads(payload),
+            data_json=payload.decode("utf-8")
+        )
+        self._history(task_id).append(event)
+        self._broadcast(task_id, (event,))
+
+        logger.debug("Published %s event for task %s", event_type.value, task_id)
+
+    def _history(self, task_id: str) -> deque[ProgressEvent]:
+        """History ring buffer for a task (created on first use)"""
+        history = self._progress_history.get(task_id)
+        if history is None:
+            history = self._progress_history[task_id] = deque(maxlen=self.history_cap)
+        return history
+
+    def _broadcast(self, task_id: str, events: Sequence[ProgressEvent]) -> None:
+        """Deliver events to every subscriber queue"""
+        subscribers = self._subscribers.get(task_id)
+        if not subscribers:
+            return
+
+        dead_queues = []
+        delivered = 0
+        for queue in subscribers:
+            for event in events:
+                try:
+                    queue.put_nowait(event)
+                    delivered += 1
+                except asyncio.QueueFull:
+                    # Never drop events silently (the lost one may be ERROR or
+                    # COMPLETE): disconnect instead, so the client reconnects
+                    # and replays history
+                    logger.warning(f"Subscriber queue full for task {task_id}, disconnecting")
+                    dead_queues.append(queue)
+                    break
+
+        # Remove dead queues (their subscribers still consume what was queued,
+        # then end)
+        for queue in dead_queues:
+            subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[task_id]
+
+        if delivered:
+            self._add_inflight(task_id, delivered)
+
+    def _discard_queued(self, task_id: str, queue: asyncio.Queue) -> None:
+        """Drop the queued events of a subscriber that is going away"""
+        unread = 0
+        while not queue.empty():
+            queue.get_nowait()
+            unread += 1
+        if unread:
+            self._add_inflight(task_id, -unread)
+
+    def publish_event_nowait(self, task_id: str, event_type: EventType, data: Dict) -> None:
+        """
+        Publish a progress event without awaiting
+
+        Must be called from the event loop thread. Use drain() to wait for
+        delivery.
+
+        Args:
+            task_id: Task identifier
+            event_type: Type of event
+            data: Event payload
+        """
+        event = ProgressEvent(
+            task_id=task_id,
+            event_type=event_type,
+            data=data
+        )
+        self._history(task_id).append(event)
+        self._broadcast(task_id, (event,))
+
+    def publish_progress_nowait(
+        self,
+        task_id: str,
+        progress: int,
+        stage: Optional[str] = None
+    ) -> None:
+        """
+        Publish a PROGRESS_UPDATE event without awaiting
+
+        Builds the payload inside the tracker so publish loops only pass
+        the changing values.
+
+        Args:
+            task_id: Task identifier
+            progress: Progress value
+            stage: Optional stage name
+        """
+        if stage is None:
+            data = {"progress": progress}
+        else:
+            data = {"progress": progress, "stage": stage}
+        self.publish_event_nowait(task_id, EventType.PROGRESS_UPDATE, data)
+
+    async def drain(self, task_id: str) -> None:
+        """
+        Wait until every subscriber has consumed the events queued for a task
+
+        Args:
+            task_id: Task identifier
+        """
+        if not self._inflight.get(task_id):
+            return
+        drained = self._drained.get(task_id)
+        if drained is None:
+            drained = self._drained[task_id] = asyncio.Event()
+        await drained.wait()
+
+    def _add_inflight(self, task_id: str, count: int) -> None:
+        """Adjust the undelivered event count for a task and wake drain() at zero"""
+        remaining = self._inflight.get(task_id, 0) + count
+        if remaining > 0:
+            self._inflight[task_id] = remaining
+            return
+        self._inflight.pop(task_id, None)
+        drained = self._drained.pop(task_id, None)
+        if drained is not None:
+            drained.set()
+
+    async def subscribe(
+        self,
+        task_id: str,
+        queue_size: Optional[int] = None,
+        ready: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[ProgressEvent]:
         """
         Subscribe to progress updates for a task
 
         Args:
             task_id: Task to subscribe to
-            queue_size: Maximum queue size
+            queue_size: Maximum queue size (defaults to subscriber_buffer);
+                the subscription ends if the queue overflows
+            ready: Set once the subscriber is registered, so publishers can
+                wait for it instead of sleeping
 
         Yields:
             ProgressEvent objects as they occur
         """
+        batches = self._listen(task_id, queue_size, ready, batched=False)
+        try:
+            async for batch in batches:
+                yield batch[0]
+        finally:
+            await batches.aclose()
+
+    async def subscribe_batches(
+        self,
+        task_id: str,
+        queue_size: Optional[int] = None,
+        ready: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[list[ProgressEvent]]:
+        """
+        Subscribe to progress updates for a task, one batch at a time
+
+        Delivery is the same as subscribe(); each wakeup additionally takes
+        every event already waiting in the queue, so high-rate consumers
+        pay one wakeup per burst. A batch counts as consumed for drain()
+        once it has been yielded.
+
+        Args:
+            task_id: Task to subscribe to
+            queue_size: Maximum queue size (defaults to subscriber_buffer);
+                the subscription ends if the queue overflows
+            ready: Set once the subscriber is registered, so publishers can
+                wait for it instead of sleeping
+
+        Yields:
+            Non-empty lists of ProgressEvent in publish order
+        """
+        batches = self._listen(task_id, queue_size, ready, batched=True)
+        try:
+            async for batch in batches:
+                yield batch
+        finally:
+            await batches.aclose()
+
+    async def _listen(
+        self,
+        task_id: str,
+        queue_size: Optional[int],
+        ready: Optional[asyncio.Event],
+        batched: bool
+    ) -> AsyncIterator[list[ProgressEvent]]:
+        """Register a subscriber queue and yield its events (shared by subscribe*)"""
+        if queue_size is None:
+            queue_size = self.subscriber_buffer
         queue: asyncio.Queue[ProgressEvent] = asyncio.Queue(maxsize=queue_size)
 
         # Register subscriber
-        async with self._lock:
-            if task_id not in self._subscribers:
-                self._subscribers[task_id] = set()
-            self._subscribers[task_id].add(queue)
-
-            # Send historical events
-            if task_id in self._progress_history:
-                for event in self._progress_history[task_id]:
-                    try:
-                        queue.put_nowait(event)
-                    except asyncio.QueueFull:
-                        logger.warning(f"Queue full during history replay for {task_id}")
-                        break
+        if task_id not in self._subscribers:
+            self._subscribers[task_id] = set()
+        self._subscribers[task_id].add(queue)
+
+        # Send historical events
+        if task_id in self._progress_history:
+            for event in self._progress_history[task_id]:
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    logger.warning(f"Queue full during history replay for {task_id}")
+                    break
+            self._add_inflight(task_id, queue.qsize())
+
+        if ready is not None:
+            ready.set()
 
         logger.info(f"New subscriber for task {task_id}")
 
@@ -179,14 +483,23 @@ class ProgressTracker:
             last_heartbeat = asyncio.get_event_loop().time()
 
             while True:
+                # Dropped by _broadcast on overflow: end once the queue is consumed
+                if queue.empty() and queue not in self._subscribers.get(task_id, ()):
+                    logger.warning(f"Subscriber for task {task_id} fell behind and was disconnected")
+                    return
+
                 try:
                     # Wait for event with timeout for heartbeat
                     timeout = heartbeat_interval - (asyncio.get_event_loop().time() - last_heartbeat)
                     if timeout <= 0:
                         timeout = heartbeat_interval
 
-                    event = await asyncio.wait_for(queue.get(), timeout=timeout)
-                    yield event
+                    batch = [await asyncio.wait_for(queue.get(), timeout=timeout)]
+                    if batched:
+                        while not queue.empty():
+                            batch.append(queue.get_nowait())
+                    self._add_inflight(task_id, -len(batch))
+                    yield batch
 
                     # Reset heartbeat timer
                     last_heartbeat = asyncio.get_event_loop().time()
@@ -198,26 +511,65 @@ class ProgressTracker:
                         event_type=EventType.HEARTBEAT,
                         data={"message": "keepalive"}
                     )
-                    yield heartbeat_event
+                    yield [heartbeat_event]
                     last_heartbeat = asyncio.get_event_loop().time()
 
         except GeneratorExit:
             logger.info(f"Subscriber disconnected from task {task_id}")
         finally:
             # Cleanup subscriber
-            async with self._lock:
-                if task_id in self._subscribers:
-                    self._subscribers[task_id].discard(queue)
-                    if not self._subscribers[task_id]:
-                        del self._subscribers[task_id]
+            if task_id in self._subscribers:
+                self._subscribers[task_id].discard(queue)
+                if not self._subscribers[task_id]:
+                    del self._subscribers[task_id]
+            # Events left unread will never be delivered
+            self._discard_queued(task_id, queue)
+
+    async def lease_subscriber(self, task_id: str) -> SubscriberLease:
+        """
+        Register a pooled subscriber queue for a task
+
+        Reuses a queue returned by release_subscriber when one is available,
+        so repeated short-lived subscriptions skip queue construction.
+
+        Args:
+            task_id: Task to subscribe to
+
+        Returns:
+            SubscriberLease to read events from; pass it to release_subscriber
+        """
+        queue = self._sub_pool.pop() if self._sub_pool else asyncio.Queue(maxsize=self.subscriber_buffer)
+
+        self._subscribers.setdefault(task_id, set()).add(queue)
+
+        return SubscriberLease(self, task_id, queue)
+
+    async def release_subscriber(self, lease: SubscriberLease) -> None:
+        """
+        Unregister a leased subscriber and return its queue to the pool
+
+        Args:
+            lease: Lease obtained from lease_subscriber
+        """
+        task_id, queue = lease.task_id, lease.queue
+
+        if task_id in self._subscribers:
+            self._subscribers[task_id].discard(queue)
+            if not self._subscribers[task_id]:
+                del self._subscribers[task_id]
+
+        # Discard unread events so the queue is clean for the next lease
+        self._discard_queued(task_id, queue)
+
+        self._sub_pool.append(queue)
 
     def get_progress_history(self, task_id: str) -> list[ProgressEvent]:
-        """Get historical progress events for a task"""
-        return self._progress_history.get(task_id, [])
+        """Get historical progress events for a task (snapshot, up to history_cap)"""
+        return list(self._progress_history.get(task_id, ()))
 
     def get_latest_progress(self, task_id: str) -> Optional[ProgressEvent]:
         """Get latest progress event for a task"""
-        history = self._progress_history.get(task_id, [])
+        history = self._progress_history.get(task_id)
         return history[-1] if history else None
 
     def get_active_tasks(self) -> list[str]:
@@ -234,21 +586,22 @@ class ProgressTracker:
             try:
                 await asyncio.sleep(300)  # Run every 5 minutes
 
-                cutoff_time = datetime.utcnow() - timedelta(minutes=self.retention_minutes)
+                cutoff_time = time.time() - self.retention_minutes * 60
                 removed_tasks = []
 
-                async with self._lock:
-                    for task_id, events in list(self._progress_history.items()):
-                        # Remove events older than retention period
-                        filtered_events = [e for e in events if e.timestamp > cutoff_time]
-
-                        if not filtered_events:
-                            # No events left, remove task if no active subscribers
-                            if task_id not in self._subscribers:
-                                del self._progress_history[task_id]
-                                removed_tasks.append(task_id)
-                        else:
-                            self._progress_history[task_id] = filtered_events
+                for task_id, events in list(self._progress_history.items()):
+                    # Remove events older than retention period
+                    filtered_events = [e for e in events if e.created_at > cutoff_time]
+
+                    if not filtered_events:
+                        # No events left, remove task if no active subscribers
+                        if task_id not in self._subscribers:
+                            del self._progress_history[task_id]
+                            removed_tasks.append(task_id)
+                    else:
+                        self._progress_history[task_id] = deque(
+                            filtered_events, maxlen=self.history_cap
+                        )
 
                 if removed_tasks:
                     logger.info(f"Cleaned up progress history for {len(removed_tasks)} tasks")
@@ -46,6 +46,16 @@ class ProsodyConfig(BaseModel):
         description="フォルマント保持（自然な声質維持）"
     )
 
+    @property
+    def is_identity(self) -> bool:
+        """音声を変化させない設定か（pitch/speed/volume/pauseがすべて無調整）"""
+        return (
+            self.pitch_shift == 0.0
+            and self.speed_rate == 1.0
+            and self.volume_db == 0.0
+            and self.pause_duration == 0.0
+        )
+
     @validator('pitch_shift')
     def validate_pitch_shift(cls, v):
         """ピッチシフトの妥当性検証"""
@@ -167,9 +177,65 @@ class ProsodyAdjuster:
         import time
         start_time = time.perf_counter()
 
+        # 無調整の設定で、既に出力形式（モノラル16bit WAV・目標サンプルレート）なら
+        # デコード→再エンコードせずにそのまま返す
+        if config.is_identity:
+            try:
+                info = sf.info(io.BytesIO(audio_data))
+            except Exception:
+                info = None
+            if (
+                info is not None
+                and info.format == 'WAV'
+                and info.subtype == 'PCM_16'
+                and info.channels == 1
+                and info.samplerate == self.target_sample_rate
+            ):
+                return ProsodyAdjustmentResult(
+                    success=True,
+                    audio_data=audio_data,
+                    sample_rate=info.samplerate,
+                    duration_original=info.duration,
+                    duration_adjusted=info.duration,
+                    adjustments_applied={},
+                    processing_time=time.perf_counter() - start_time
+                )
+
+        # Step 1: 音声データ読み込み
         try:
-            # Step 1: 音声データ読み込み
             audio, sr = self._load_audio(audio_data)
+        except Exception as e:
+            return self._error_result(e, time.perf_counter() - start_time)
+
+        return self.adjust_prosody_samples(audio, sr, config, start_time=start_time)
+
+    def adjust_prosody_samples(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        config: ProsodyConfig,
+        start_time: Optional[float] = None
+    ) -> ProsodyAdjustmentResult:
+        """
+        デコード済みの音声サンプルに対するProsody調整
+
+        WAVバイト列へのエンコード→再デコードを挟まずに、前段の処理結果
+        （文連結など）をそのまま調整できる。
+
+        Args:
+            audio: モノラル音声サンプル
+            sr: サンプルレート
+            config: Prosody調整パラメータ
+            start_time: 処理時間計測の起点 (time.perf_counter)
+
+        Returns:
+            ProsodyAdjustmentResult: 調整結果
+        """
+        import time
+        if start_time is None:
+            start_time = time.perf_counter()
+
+        try:
             duration_original = len(audio) / sr
 
             logger.info(f"元音声: {duration_original:.2f}秒, {sr}Hz, {len(audio)}サンプル")
@@ -223,7 +289,7 @@ class ProsodyAdjuster:
             audio_adjusted = self._normalize_audio(audio_adjusted)
 
             # Step 5: WAV形式でエンコード
-            audio_bytes = self._encode_audio(audio_adjusted, sr)
+            audio_bytes = self.encode_audio(audio_adjusted, sr)
 
             processing_time = time.perf_counter() - start_time
 
@@ -243,18 +309,22 @@ class ProsodyAdjuster:
             )
 
         except Exception as e:
-            processing_time = time.perf_counter() - start_time
-            logger.error(f"Prosody調整エラー: {str(e)}", exc_info=True)
+            return self._error_result(e, time.perf_counter() - start_time)
 
-            return ProsodyAdjustmentResult(
-                success=False,
-                sample_rate=0,
-                duration_original=0.0,
-                duration_adjusted=0.0,
-                adjustments_applied={},
-                processing_time=processing_time,
-                error_message=str(e)
-            )
+    @staticmethod
+    def _error_result(error: Exception, processing_time: float) -> ProsodyAdjustmentResult:
+        """失敗時のProsodyAdjustmentResultを生成"""
+        logger.error(f"Prosody調整エラー: {str(error)}", exc_info=True)
+
+        return ProsodyAdjustmentResult(
+            success=False,
+            sample_rate=0,
+            duration_original=0.0,
+            duration_adjusted=0.0,
+            adjustments_applied={},
+            processing_time=processing_time,
+            error_message=str(error)
+        )
 
     def _load_audio(self, audio_data: bytes) -> Tuple[np.ndarray, int]:
         """
@@ -421,9 +491,12 @@ class ProsodyAdjuster:
             logger.warning(f"正規化エラー: {str(e)}, 元音声を返します")
             return audio
 
-    def _encode_audio(self, audio: np.ndarray, sr: int) -> bytes:
+    @staticmethod
+    def encode_audio(audio: np.ndarray, sr: int) -> bytes:
         """
-        音声をWAV形式でエンコード
+        音声をWAV形式 (PCM_16) でエンコード
+
+        concatenate_samples_with_silenceのサンプル列を調整せずに返す場合にも使う。
 
         Args:
             audio: 音声データ
@@ -467,6 +540,39 @@ class ProsodyAdjuster:
         if len(audio_segments) == 1:
             return audio_segments[0]
 
+        combined_audio = ProsodyAdjuster.concatenate_samples_with_silence(
+            audio_segments, silence_duration, sample_rate
+        )
+
+        # WAVエンコード
+        buffer = io.BytesIO()
+        sf.write(buffer, combined_audio, sample_rate, format='WAV', subtype='PCM_16')
+        buffer.seek(0)
+        return buffer.read()
+
+    @staticmethod
+    def concatenate_samples_with_silence(
+        audio_segments: list,
+        silence_duration: float = 0.3,
+        sample_rate: int = 24000
+    ) -> np.ndarray:
+        """
+        複数の音声セグメントを無音で連結し、エンコード前のサンプル列を返す。
+
+        後段でProsody調整する場合はこちらを使い、WAVエンコード/デコードの
+        往復を省く。
+
+        Args:
+            audio_segments: WAVバイト列のリスト
+            silence_duration: セグメント間の無音長 (秒)
+            sample_rate: サンプルレート (Hz)
+
+        Returns:
+            連結された音声サンプル (float32, モノラル, sample_rate Hz)
+        """
+        if not audio_segments:
+            raise ValueError("音声セグメントが空です")
+
         fade_samples = int(sample_rate * 0.01)  # 10ms fade
         silence_samples = int(sample_rate * silence_duration)
         silence = np.zeros(silence_samples, dtype=np.float32)
@@ -519,18 +625,13 @@ class ProsodyAdjuster:
         if peak > 0.95:
             combined_audio = combined_audio * (0.95 / peak)
 
-        # WAVエンコード
-        buffer = io.BytesIO()
-        sf.write(buffer, combined_audio, sample_rate, format='WAV', subtype='PCM_16')
-        buffer.seek(0)
-
         logger.info(
             f"音声連結完了: {len(audio_segments)}セグメント, "
             f"無音{silence_duration:.2f}s, "
             f"合計{len(combined_audio) / sample_rate:.2f}s"
         )
 
-        return buffer.read()
+        return combined_audio
 
     def validate_audio(self, audio_data: bytes) -> Dict[str, Any]:
         """
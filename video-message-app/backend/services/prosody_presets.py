@@ -7,6 +7,7 @@ Purpose: Manage prosody adjustment presets for different voice styles.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional
 from enum import Enum
 
@@ -19,7 +20,7 @@ class PresetCategory(str, Enum):
     CUSTOM = "custom"            # カスタム
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProsodyPreset:
     """Prosody adjustment preset configuration."""
 
@@ -113,6 +114,7 @@ def list_presets(category: Optional[PresetCategory] = None) -> List[ProsodyPrese
     return presets
 
 
+@lru_cache(maxsize=None)
 def get_preset_by_name(name: str) -> ProsodyPreset:
     """
     Get preset by name.
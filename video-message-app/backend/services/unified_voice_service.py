@@ -6,6 +6,7 @@ VOICEVOXとQwen3-TTSを統一インターフェースで管理
 import asyncio
 import os
 import re
+import time
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -21,6 +22,7 @@ from .prosody_adjuster import (
     get_prosody_adjuster,
     get_emotion_config,
 )
+from core.task_group import raise_from_group
 
 class VoiceProvider(str, Enum):
     """音声プロバイダー"""
@@ -61,10 +63,19 @@ class VoiceSynthesisRequest(BaseModel):
 class UnifiedVoiceService:
     """統合音声サービス"""
 
+    # 複数文合成時のQwen3-TTS同時リクエスト数（GPUサーバー側の負荷上限）
+    QWEN_TTS_MAX_PARALLEL = 2
+
+    # 未知のプロファイルIDを要求された際、Qwen3-TTSプロファイルを再取得する最短間隔（秒）
+    PROFILE_REFRESH_TTL = 60.0
+
     def __init__(self):
         self.voicevox_client: Optional[VOICEVOXClient] = None
         self.qwen_tts_client: Optional[Qwen3TTSClient] = None
         self._voice_profiles: Dict[str, VoiceProfile] = {}
+        # Qwen3-TTSプロファイルの最終取得時刻 (time.monotonic) と再取得の直列化用ロック
+        self._qwen_profiles_loaded_at: float = 0.0
+        self._profile_refresh_lock = asyncio.Lock()
 
     async def initialize(self):
         """サービス初期化"""
@@ -118,6 +129,9 @@ class UnifiedVoiceService:
         if not self.qwen_tts_client:
             return
 
+        # 失敗時も含めて取得を試みた時刻を記録（未知ID参照のたびに再試行しない）
+        self._qwen_profiles_loaded_at = time.monotonic()
+
         try:
             if not await self.qwen_tts_client.check_service_health():
                 logger.warning("Qwen3-TTSサービスが利用不可、プロファイル読み込みスキップ")
@@ -240,6 +254,47 @@ class UnifiedVoiceService:
         sentences = [s.strip() for s in parts if s.strip()]
         return sentences
 
+    async def _synthesize_qwen_segments(
+        self, sentences: List[str], profile: VoiceProfile
+    ) -> List[bytes]:
+        """
+        複数文をQwen3-TTSで合成（固定数ワーカーによる並列処理）
+
+        全文分のコルーチンを先に生成せず、QWEN_TTS_MAX_PARALLEL個のワーカーが
+        キューから文を取り出して合成する。保持される処理中データは
+        文数ではなくワーカー数に比例する。
+
+        Returns:
+            入力順に並んだ音声セグメントのリスト
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(sentences):
+            queue.put_nowait(item)
+
+        results: List[Optional[bytes]] = [None] * len(sentences)
+
+        async def worker() -> None:
+            while not queue.empty():
+                i, sentence = queue.get_nowait()
+                logger.debug(f"文 {i + 1}/{len(sentences)} 合成中: '{sentence[:30]}...'")
+                results[i] = await self.qwen_tts_client.synthesize_with_clone(
+                    text=sentence,
+                    profile_id=profile.id,
+                    language=profile.language,
+                    speed=1.0,
+                )
+
+        # TaskGroup: 1文でも失敗した場合や呼び出し元がキャンセルされた場合は
+        # 残りのワーカーもキャンセルされる
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(self.QWEN_TTS_MAX_PARALLEL, len(sentences))):
+                    tg.create_task(worker())
+        except ExceptionGroup as eg:
+            raise_from_group(eg)
+
+        return results
+
     async def _synthesize_qwen_tts(self, request: VoiceSynthesisRequest) -> bytes:
         """
         Qwen3-TTS音声合成
@@ -276,6 +331,16 @@ class UnifiedVoiceService:
         sentences = self._split_sentences(request.text)
         logger.info(f"テキスト分割: {len(sentences)}文")
 
+        # --- Step 5の要否（Step 4で連結結果をエンコードするかどうかに影響） ---
+        needs_prosody = (
+            prosody_config.pitch_shift != 0.0
+            or prosody_config.speed_rate != 1.0
+            or prosody_config.volume_db != 0.0
+            or (len(sentences) <= 1 and prosody_config.pause_duration > 0.0)
+        )
+        # 複数文かつProsody調整ありの場合は連結結果をサンプル列のまま渡す
+        combined_samples = None
+
         # --- Step 4: 各文をQwen3-TTSで合成（speed=1.0で生音声取得） ---
         try:
             if len(sentences) <= 1:
@@ -288,24 +353,24 @@ class UnifiedVoiceService:
                 )
             else:
                 # 複数文: 各文を個別合成して連結
-                audio_segments = []
-                for i, sentence in enumerate(sentences):
-                    logger.debug(f"文 {i + 1}/{len(sentences)} 合成中: '{sentence[:30]}...'")
-                    segment = await self.qwen_tts_client.synthesize_with_clone(
-                        text=sentence,
-                        profile_id=profile.id,
-                        language=profile.language,
-                        speed=1.0,
-                    )
-                    audio_segments.append(segment)
+                audio_segments = await self._synthesize_qwen_segments(sentences, profile)
 
                 # 無音で連結（デフォルト0.3秒、pause_durationで調整可能）
                 silence_sec = request.pause_duration if request.pause_duration > 0 else 0.3
-                raw_audio = ProsodyAdjuster.concatenate_with_silence(
-                    audio_segments=audio_segments,
-                    silence_duration=silence_sec,
-                    sample_rate=24000,
-                )
+                if needs_prosody:
+                    # WAVエンコード→再デコードの往復を省く
+                    combined_samples = ProsodyAdjuster.concatenate_samples_with_silence(
+                        audio_segments=audio_segments,
+                        silence_duration=silence_sec,
+                        sample_rate=24000,
+                    )
+                    raw_audio = None
+                else:
+                    raw_audio = ProsodyAdjuster.concatenate_with_silence(
+                        audio_segments=audio_segments,
+                        silence_duration=silence_sec,
+                        sample_rate=24000,
+                    )
                 logger.info(
                     f"文連結完了: {len(audio_segments)}セグメント, "
                     f"無音{silence_sec:.2f}秒"
@@ -316,27 +381,27 @@ class UnifiedVoiceService:
             raise
 
         # --- Step 5: Prosody調整（pitch/speed/volume） ---
-        needs_prosody = (
-            prosody_config.pitch_shift != 0.0
-            or prosody_config.speed_rate != 1.0
-            or prosody_config.volume_db != 0.0
-            or (len(sentences) <= 1 and prosody_config.pause_duration > 0.0)
-        )
-
         if needs_prosody:
+            adjuster = get_prosody_adjuster()
             try:
-                adjuster = get_prosody_adjuster()
                 # 単文でpause_durationが設定済みの場合はProsodyAdjusterに任せる
                 # 複数文の場合はconcatenate_with_silenceで既に処理済みなので
-                # pause_durationは0にリセット
-                config_for_adjust = ProsodyConfig(
-                    speed_rate=prosody_config.speed_rate,
-                    pitch_shift=prosody_config.pitch_shift,
-                    volume_db=prosody_config.volume_db,
-                    pause_duration=prosody_config.pause_duration if len(sentences) <= 1 else 0.0,
-                    preserve_formants=prosody_config.preserve_formants,
-                )
-                result = adjuster.adjust_prosody(raw_audio, config_for_adjust)
+                # pause_durationは0にリセット（それ以外は構築済みのConfigをそのまま使う）
+                config_for_adjust = prosody_config
+                if len(sentences) > 1 and prosody_config.pause_duration > 0.0:
+                    config_for_adjust = ProsodyConfig(
+                        speed_rate=prosody_config.speed_rate,
+                        pitch_shift=prosody_config.pitch_shift,
+                        volume_db=prosody_config.volume_db,
+                        pause_duration=0.0,
+                        preserve_formants=prosody_config.preserve_formants,
+                    )
+                if combined_samples is not None:
+                    result = adjuster.adjust_prosody_samples(
+                        combined_samples, 24000, config_for_adjust
+                    )
+                else:
+                    result = adjuster.adjust_prosody(raw_audio, config_for_adjust)
 
                 if result.success and result.audio_data:
                     logger.info(
@@ -348,11 +413,16 @@ class UnifiedVoiceService:
                     logger.warning(
                         f"Prosody調整失敗（生音声を返します）: {result.error_message}"
                     )
-                    return raw_audio
 
             except Exception as e:
                 logger.warning(f"Prosody調整例外（生音声を返します）: {e}")
-                return raw_audio
+
+            if raw_audio is None:
+                try:
+                    raw_audio = ProsodyAdjuster.encode_audio(combined_samples, 24000)
+                except Exception as e:
+                    logger.error(f"Qwen3-TTS連結音声のエンコードエラー: {e}")
+                    raise
 
         return raw_audio
 
@@ -418,8 +488,27 @@ class UnifiedVoiceService:
             raise ValueError(f"サポートされていないクローンプロバイダー: {provider}")
 
     async def get_voice_profile(self, profile_id: str) -> Optional[VoiceProfile]:
-        """音声プロファイルを取得"""
-        return self._voice_profiles.get(profile_id)
+        """
+        音声プロファイルを取得
+
+        通常はメモリ上のテーブル参照のみ。未知のIDの場合に限り、前回取得から
+        PROFILE_REFRESH_TTL秒以上経過していればQwen3-TTSプロファイルを再取得する
+        （他ワーカーでクローンされたプロファイル等を拾うため）。
+        """
+        profile = self._voice_profiles.get(profile_id)
+        if profile is not None or not self.qwen_tts_client:
+            return profile
+
+        async with self._profile_refresh_lock:
+            # 待機中に他のリクエストが再取得済みの場合はそれを使う
+            profile = self._voice_profiles.get(profile_id)
+            if profile is None and (
+                time.monotonic() - self._qwen_profiles_loaded_at >= self.PROFILE_REFRESH_TTL
+            ):
+                await self._load_qwen_tts_profiles()
+                profile = self._voice_profiles.get(profile_id)
+
+        return profile
 
     async def reload_profiles(self) -> Dict[str, Any]:
         """音声プロファイルを再読み込み"""
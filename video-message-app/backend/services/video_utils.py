@@ -20,6 +20,10 @@ logger = logging.getLogger(__name__)
 # Storage directory for path validation
 STORAGE_DIR = Path(os.environ.get("STORAGE_PATH", "/app/storage"))
 
+# Resolved once at import; _validate_path runs for every frame/file helper
+_STORAGE_RESOLVED = os.path.realpath(STORAGE_DIR)
+_STORAGE_PREFIX = _STORAGE_RESOLVED + os.sep
+
 
 def _validate_path(file_path: str, must_exist: bool = True) -> Path:
     """
@@ -40,24 +44,19 @@ def _validate_path(file_path: str, must_exist: bool = True) -> Path:
     Raises:
         ValueError: If path is invalid or outside allowed directory
     """
-    path = Path(file_path)
-
     # Resolve to absolute path first (handles symlinks atomically)
-    resolved = path.resolve()
-    storage_resolved = STORAGE_DIR.resolve()
+    resolved = os.path.realpath(file_path)
 
     # Ensure path is within STORAGE_DIR (prevents CWE-22 and CWE-61)
     # Use os.sep to ensure proper directory boundary check
-    storage_prefix = str(storage_resolved) + os.sep
-    if not (str(resolved) == str(storage_resolved) or
-            str(resolved).startswith(storage_prefix)):
+    if not (resolved == _STORAGE_RESOLVED or resolved.startswith(_STORAGE_PREFIX)):
         raise ValueError(f"Path outside allowed directory: {file_path}")
 
     # Check existence if required
-    if must_exist and not resolved.exists():
+    if must_exist and not os.path.exists(resolved):
         raise ValueError(f"File not found: {file_path}")
 
-    return resolved
+    return Path(resolved)
 
 
 def read_video_frames(video_path: str) -> Tuple[List[np.ndarray], int]:
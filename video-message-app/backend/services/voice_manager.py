@@ -1,7 +1,12 @@
 import os
 import uuid
+import hashlib
 import json
-import aiofiles
+import asyncio
+import bisect
+import io
+import logging
+from tempfile import SpooledTemporaryFile
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
@@ -9,61 +14,316 @@ from fastapi import UploadFile
 import mutagen
 from mutagen import File as MutagenFile
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# アップロード書き込み時のチャンクサイズ（ピークメモリをこのサイズに抑える）
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MiB
+
+# 音声情報キャッシュの最大エントリ数（content_hash単位）
+AUDIO_INFO_CACHE_MAX_ENTRIES = 1024
+
+# メタデータ書き込みの遅延時間（秒）。この間の更新は1回の書き込みにまとめる
+METADATA_FLUSH_DELAY = 0.5
+
+# 変更ログがこのサイズ未満ならコンパクションしない
+METADATA_LOG_MIN_COMPACT_BYTES = 64 * 1024
+
+# 対応MIMEタイプ / 拡張子（検証のたびにリストを生成しないようモジュール定数にする）
+SUPPORTED_MIME_TYPES = frozenset({
+    'audio/mpeg',     # MP3
+    'audio/wav',      # WAV
+    'audio/flac',     # FLAC
+    'audio/mp4',      # MP4 audio / M4A
+    'audio/m4a',      # M4A (alternative MIME type)
+    'audio/x-m4a',    # M4A (alternative MIME type)
+    'audio/aac',      # AAC (sometimes used for M4A)
+})
+SUPPORTED_EXTENSIONS = frozenset({'.mp3', '.wav', '.flac', '.m4a', '.mp4', '.aac'})
+
+# コンテンツタイプ -> 保存時の拡張子
+EXTENSION_MAP: Dict[str, str] = {
+    'audio/mpeg': '.mp3',
+    'audio/wav': '.wav',
+    'audio/flac': '.flac',
+    'audio/mp4': '.mp4',
+    'audio/m4a': '.m4a',
+}
+
+# アップロードサイズ上限（10MB）
+MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+
+def _json_loads(data: bytes):
+    """JSONバイト列のパース（orjsonが無ければ標準json）"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _disk_fileno(src) -> Optional[int]:
+    """アップロード元がディスク上の実ファイルならfdを返す（メモリ上ならNone）"""
+    if not hasattr(os, "sendfile"):
+        return None
+    if isinstance(src, SpooledTemporaryFile) and not getattr(src, "_rolled", False):
+        return None
+    try:
+        return src.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def _sendfile_and_hash(src, src_fd: int, dst_path: Path) -> Tuple[int, str]:
+    """os.sendfileでカーネル内コピーし、ハッシュは元ファイルの読み込みで計算する"""
+    offset = src.tell()
+    remaining = os.fstat(src_fd).st_size - offset
+    total_size = 0
+    dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while remaining > 0:
+            sent = os.sendfile(dst_fd, src_fd, offset + total_size, remaining)
+            if sent == 0:
+                break
+            total_size += sent
+            remaining -= sent
+    finally:
+        os.close(dst_fd)
+
+    hasher = hashlib.blake2b()
+    src.seek(offset)
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        hasher.update(chunk)
+    return total_size, hasher.hexdigest()
+
+
+def _copy_and_hash(src, dst_path: Path) -> Tuple[int, str]:
+    """ファイルオブジェクトをチャンク単位でコピーし、(サイズ, blake2bダイジェスト)を返す"""
+    # ディスクに退避済みのアップロードはユーザー空間を経由せずにコピーする
+    src_fd = _disk_fileno(src)
+    if src_fd is not None:
+        offset = src.tell()
+        try:
+            return _sendfile_and_hash(src, src_fd, dst_path)
+        except OSError:
+            # sendfile非対応のファイルシステム等では通常のコピーにフォールバック
+            src.seek(offset)
+
+    total_size = 0
+    hasher = hashlib.blake2b()
+    with open(dst_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as dst:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            dst.write(chunk)
+            total_size += len(chunk)
+            hasher.update(chunk)
+    return total_size, hasher.hexdigest()
+
 class VoiceManager:
     def __init__(self, storage_path: str = "./storage/voices"):
         self.storage_path = Path(storage_path)
         self.metadata_file = self.storage_path / "voices_metadata.json"
+        # 変更ログ（1行1操作のJSON Lines）。読み込み時にスナップショットへ再生する
+        self.metadata_log = self.storage_path / "voices_metadata.log"
+        # メタデータのメモリキャッシュ（スナップショット・ログのmtimeで無効化）
+        self._cache: Optional[Dict] = None
+        self._cache_signature: Optional[Tuple] = None
+        # user_id -> voice_idリスト（upload_date昇順）。全件走査・ソートを避けるための索引
+        self._user_index: Dict[str, List[str]] = {}
+        # file_path -> 参照している音声数。同一内容のアップロードは1ファイルを共有する
+        self._blob_refs: Dict[str, int] = {}
+        # content_hash -> mutagenで取得した音声情報
+        self._audio_info_cache: Dict[str, Dict] = {}
+        # 未書き込みの変更操作 / 遅延書き込みタスク
+        self._pending_ops: List[Dict] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # 変更ログ追記・コンパクションの直列化（追記順序の入れ替わりを防ぐ）
+        self._write_lock = asyncio.Lock()
         self._ensure_storage_directory()
         
     def _ensure_storage_directory(self):
         """ストレージディレクトリの作成"""
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
-        # メタデータファイルが存在しない場合は作成
-        if not self.metadata_file.exists():
-            self._save_metadata({})
+        # メタデータファイルが存在しない場合は作成し、残っている変更ログは起動時に畳み込む
+        if not self.metadata_file.exists() or self._log_size() > 0:
+            self._cache = self._load_metadata()
+            self._rebuild_user_index(self._cache)
+            self._cache_signature = self._save_metadata(self._serialize_metadata(self._cache))
     
     def _load_metadata(self) -> Dict:
-        """メタデータファイルの読み込み"""
+        """メタデータの読み込み（スナップショット + 変更ログの再生）"""
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.metadata_file, 'rb') as f:
+                metadata = _json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            metadata = {}
+
+        try:
+            with open(self.metadata_log, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        op = _json_loads(line)
+                    except json.JSONDecodeError:
+                        # 書き込み途中で中断された末尾行
+                        break
+                    if op.get("op") == "put":
+                        metadata[op["voice_id"]] = op["data"]
+                    elif op.get("op") == "del":
+                        metadata.pop(op["voice_id"], None)
+        except FileNotFoundError:
+            pass
+
+        return metadata
     
-    def _save_metadata(self, metadata: Dict):
-        """メタデータファイルの保存"""
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    def _get_metadata(self) -> Dict:
+        """メタデータの取得（ファイルが更新されていなければキャッシュを返す）"""
+        # 未書き込み・書き込み中の変更がある間はメモリ上の内容が正
+        if self._cache is not None and (
+            self._pending_ops or self._flush_pending() or self._write_lock.locked()
+        ):
+            return self._cache
+
+        signature = self._disk_signature()
+        if self._cache is None or signature != self._cache_signature:
+            self._cache = self._load_metadata()
+            self._cache_signature = signature
+            self._rebuild_user_index(self._cache)
+        return self._cache
+
+    def _disk_signature(self) -> Tuple:
+        """スナップショットと変更ログのmtime_ns"""
+        signature = []
+        for path in (self.metadata_file, self.metadata_log):
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _log_size(self) -> int:
+        """変更ログのサイズ（バイト）"""
+        try:
+            return os.stat(self.metadata_log).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _rebuild_user_index(self, metadata: Dict):
+        """ユーザー別索引・ファイル参照数の再構築"""
+        index: Dict[str, List[str]] = {}
+        refs: Dict[str, int] = {}
+        for voice_id, voice in metadata.items():
+            index.setdefault(voice.get("user_id"), []).append(voice_id)
+            file_path = voice.get("file_path")
+            if file_path:
+                refs[file_path] = refs.get(file_path, 0) + 1
+        for voice_ids in index.values():
+            voice_ids.sort(key=lambda vid: metadata[vid].get("upload_date", ""))
+        self._user_index = index
+        self._blob_refs = refs
+
+    @staticmethod
+    def _serialize_metadata(metadata: Dict) -> bytes:
+        """メタデータをJSONバイト列に変換"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+        return json.dumps(metadata, ensure_ascii=False, indent=2).encode('utf-8')
+
+    @staticmethod
+    def _serialize_ops(ops: List[Dict]) -> bytes:
+        """変更操作をJSON Linesのバイト列に変換"""
+        if ORJSON_AVAILABLE:
+            return b"".join(orjson.dumps(op) + b"\n" for op in ops)
+        return b"".join(json.dumps(op, ensure_ascii=False).encode('utf-8') + b"\n" for op in ops)
+    
+    def _save_metadata(self, data: bytes) -> Tuple:
+        """スナップショットをアトミックに書き込み、変更ログを空にする（コンパクション）"""
+        temp_file = self.metadata_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, self.metadata_file)
+        # ログの操作は冪等なので、ここで中断しても再生結果は変わらない
+        with open(self.metadata_log, 'wb'):
+            pass
+        return self._disk_signature()
+
+    def _append_log(self, data: bytes) -> Tuple:
+        """変更ログに追記"""
+        with open(self.metadata_log, 'ab') as f:
+            f.write(data)
+        return self._disk_signature()
+
+    def _needs_compaction(self) -> bool:
+        """変更ログがスナップショットの2倍を超えたらコンパクションする"""
+        try:
+            snapshot_size = os.stat(self.metadata_file).st_size
+        except FileNotFoundError:
+            snapshot_size = 0
+        return self._log_size() > max(2 * snapshot_size, METADATA_LOG_MIN_COMPACT_BYTES)
+
+    def _flush_pending(self) -> bool:
+        """遅延書き込みタスクが実行中か"""
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def _record_op(self, op: Dict):
+        """変更操作を記録し、遅延書き込みを予約する（イベントループ外では即時書き込み）"""
+        self._pending_ops.append(op)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            ops, self._pending_ops = self._pending_ops, []
+            self._cache_signature = self._append_log(self._serialize_ops(ops))
+            return
+        if not self._flush_pending():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """METADATA_FLUSH_DELAYの間に溜まった変更をまとめて書き込む"""
+        try:
+            while self._pending_ops:
+                await asyncio.sleep(METADATA_FLUSH_DELAY)
+                await self.flush()
+        except Exception:
+            # 未書き込みの操作は_pending_opsに残り、次の変更またはflush()で再試行される
+            logger.exception("メタデータ変更ログの遅延書き込みに失敗")
+
+    async def flush(self):
+        """未書き込みの変更操作を変更ログへ追記する"""
+        async with self._write_lock:
+            if not self._pending_ops:
+                return
+            ops, self._pending_ops = self._pending_ops, []
+            data = self._serialize_ops(ops)
+            try:
+                self._cache_signature = await asyncio.to_thread(self._append_log, data)
+            except BaseException as e:
+                # 書き込めなかった操作は待機中の操作より前に戻して順序を保つ
+                self._pending_ops[:0] = ops
+                logger.error(f"メタデータ変更ログ書き込みエラー: {e}")
+                raise
+
+            if self._needs_compaction():
+                data = self._serialize_metadata(self._cache)
+                self._cache_signature = await asyncio.to_thread(self._save_metadata, data)
     
     def validate_audio_file(self, file: UploadFile) -> Tuple[bool, str]:
         """音声ファイルのバリデーション"""
-        # ファイル形式の確認
-        supported_formats = [
-            'audio/mpeg',     # MP3
-            'audio/wav',      # WAV
-            'audio/flac',     # FLAC
-            'audio/mp4',      # MP4 audio / M4A
-            'audio/m4a',      # M4A (alternative MIME type)
-            'audio/x-m4a',    # M4A (alternative MIME type)
-            'audio/aac'       # AAC (sometimes used for M4A)
-        ]
-        
         # MIMEタイプでの検証
-        is_valid_mime = file.content_type in supported_formats
+        is_valid_mime = file.content_type in SUPPORTED_MIME_TYPES
         
         # ファイル拡張子での補完検証
         file_extension = Path(file.filename).suffix.lower()
-        supported_extensions = ['.mp3', '.wav', '.flac', '.m4a', '.mp4', '.aac']
-        is_valid_extension = file_extension in supported_extensions
+        is_valid_extension = file_extension in SUPPORTED_EXTENSIONS
         
         if not is_valid_mime and not is_valid_extension:
             return False, f"サポートされていないファイル形式です。対応形式: MP3, WAV, FLAC, M4A, MP4"
         
         # ファイルサイズの確認（10MB制限）
-        max_size = 10 * 1024 * 1024  # 10MB
-        if file.size and file.size > max_size:
-            return False, f"ファイルサイズが大きすぎます。最大{max_size // (1024*1024)}MBまで対応しています。"
+        if file.size and file.size > MAX_UPLOAD_SIZE:
+            return False, f"ファイルサイズが大きすぎます。最大{MAX_UPLOAD_SIZE // (1024*1024)}MBまで対応しています。"
         
         return True, ""
     
@@ -79,16 +339,35 @@ class VoiceManager:
         
         # ファイル拡張子の決定
         file_extension = self._get_file_extension(file.content_type)
-        filename = f"{voice_id}{file_extension}"
-        file_path = self.storage_path / filename
+        temp_path = self.storage_path / f".{voice_id}{file_extension}.part"
         
-        # ファイルの保存
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+        # ファイルの保存（1回のスレッド実行でチャンクコピーとハッシュ計算を行う）
+        try:
+            total_size, content_hash = await asyncio.to_thread(
+                _copy_and_hash, file.file, temp_path
+            )
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
         
-        # 音声ファイルのメタデータ取得
-        audio_info = self._get_audio_info(file_path)
+        # 内容ハッシュをファイル名にし、同一内容のアップロードは既存ファイルを共有する
+        # 参照カウントは次のawaitより前に増やし、並行するdelete_voiceに共有ファイルを消させない
+        file_path = self._blob_path(content_hash, file_extension)
+        blob_key = str(file_path)
+        self._blob_refs[blob_key] = self._blob_refs.get(blob_key, 0) + 1
+        try:
+            await asyncio.to_thread(self._store_blob, temp_path, file_path)
+            
+            # 音声ファイルのメタデータ取得
+            audio_info = await self._get_audio_info(file_path, content_hash)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            refs = self._blob_refs.get(blob_key, 1) - 1
+            if refs > 0:
+                self._blob_refs[blob_key] = refs
+            else:
+                self._blob_refs.pop(blob_key, None)
+            raise
         
         # メタデータの作成
         voice_metadata = {
@@ -97,7 +376,8 @@ class VoiceManager:
             "original_filename": file.filename,
             "file_path": str(file_path),
             "upload_date": datetime.now().isoformat(),
-            "file_size": len(content),
+            "file_size": total_size,
+            "content_hash": content_hash,
             "content_type": file.content_type,
             "duration": audio_info.get("duration", 0),
             "sample_rate": audio_info.get("sample_rate", 0),
@@ -106,25 +386,47 @@ class VoiceManager:
         }
         
         # メタデータの保存
-        metadata = self._load_metadata()
+        metadata = self._get_metadata()
         metadata[voice_id] = voice_metadata
-        self._save_metadata(metadata)
+        bisect.insort(
+            self._user_index.setdefault(user_id, []),
+            voice_id,
+            key=lambda vid: metadata[vid].get("upload_date", "")
+        )
+        self._record_op({"op": "put", "voice_id": voice_id, "data": voice_metadata})
         
         return voice_id, voice_metadata
     
+    def _blob_path(self, content_hash: str, file_extension: str) -> Path:
+        """内容ハッシュから共有ファイルのパスを決定"""
+        return self.storage_path / content_hash[:2] / f"{content_hash}{file_extension}"
+    
+    def _store_blob(self, temp_path: Path, blob_path: Path):
+        """一時ファイルを内容アドレスのパスへ移動（既に存在すれば一時ファイルを破棄）"""
+        if blob_path.exists():
+            temp_path.unlink()
+        else:
+            blob_path.parent.mkdir(exist_ok=True)
+            os.replace(temp_path, blob_path)
+    
     def _get_file_extension(self, content_type: str) -> str:
         """コンテンツタイプから拡張子を取得"""
-        extension_map = {
-            'audio/mpeg': '.mp3',
-            'audio/wav': '.wav',
-            'audio/flac': '.flac',
-            'audio/mp4': '.mp4',
-            'audio/m4a': '.m4a'
-        }
-        return extension_map.get(content_type, '.mp3')
+        return EXTENSION_MAP.get(content_type, '.mp3')
     
-    def _get_audio_info(self, file_path: Path) -> Dict:
-        """音声ファイルの情報を取得"""
+    async def _get_audio_info(self, file_path: Path, content_hash: str) -> Dict:
+        """音声ファイルの情報を取得（同一内容はキャッシュ、解析はスレッドで実行）"""
+        cached = self._audio_info_cache.get(content_hash)
+        if cached is not None:
+            return cached
+
+        audio_info = await asyncio.to_thread(self._get_audio_info_sync, file_path)
+        if len(self._audio_info_cache) >= AUDIO_INFO_CACHE_MAX_ENTRIES:
+            self._audio_info_cache.pop(next(iter(self._audio_info_cache)))
+        self._audio_info_cache[content_hash] = audio_info
+        return audio_info
+
+    def _get_audio_info_sync(self, file_path: Path) -> Dict:
+        """音声ファイルの情報を取得（mutagenによる同期解析）"""
         try:
             audio_file = MutagenFile(file_path)
             if audio_file is not None:
@@ -134,54 +436,56 @@ class VoiceManager:
                     "bitrate": getattr(audio_file.info, 'bitrate', 0)
                 }
         except Exception as e:
-            print(f"音声ファイル情報の取得に失敗: {e}")
+            logger.warning(f"音声ファイル情報の取得に失敗: {e}")
         
         return {"duration": 0, "sample_rate": 0, "bitrate": 0}
     
     def get_voice_list(self, user_id: str = "default") -> List[Dict]:
         """ユーザーの音声リストを取得"""
-        metadata = self._load_metadata()
-        user_voices = [
-            voice for voice in metadata.values() 
-            if voice.get("user_id") == user_id
-        ]
+        metadata = self._get_metadata()
         
-        # アップロード日時でソート（新しい順）
-        user_voices.sort(key=lambda x: x.get("upload_date", ""), reverse=True)
-        
-        return user_voices
+        # 索引はアップロード日時の昇順なので逆順で返す（新しい順）
+        return [metadata[vid] for vid in reversed(self._user_index.get(user_id, ()))]
     
     def get_voice_metadata(self, voice_id: str) -> Optional[Dict]:
         """特定の音声のメタデータを取得"""
-        metadata = self._load_metadata()
+        metadata = self._get_metadata()
         return metadata.get(voice_id)
     
     def update_voice_metadata(self, voice_id: str, updates: Dict):
         """音声のメタデータを更新"""
-        metadata = self._load_metadata()
+        metadata = self._get_metadata()
         if voice_id in metadata:
             metadata[voice_id].update(updates)
-            self._save_metadata(metadata)
+            if "user_id" in updates or "upload_date" in updates or "file_path" in updates:
+                self._rebuild_user_index(metadata)
+            self._record_op({"op": "put", "voice_id": voice_id, "data": metadata[voice_id]})
     
     def delete_voice(self, voice_id: str, user_id: str = "default") -> bool:
         """音声の削除"""
-        metadata = self._load_metadata()
+        metadata = self._get_metadata()
         voice_data = metadata.get(voice_id)
         
         if not voice_data or voice_data.get("user_id") != user_id:
             return False
         
-        # ファイルの削除
-        try:
-            file_path = Path(voice_data["file_path"])
-            if file_path.exists():
-                file_path.unlink()
-        except Exception as e:
-            print(f"ファイル削除エラー: {e}")
+        # ファイルの削除（他の音声から参照されていない場合のみ）
+        refs = self._blob_refs.get(voice_data["file_path"], 1) - 1
+        if refs > 0:
+            self._blob_refs[voice_data["file_path"]] = refs
+        else:
+            self._blob_refs.pop(voice_data["file_path"], None)
+            try:
+                file_path = Path(voice_data["file_path"])
+                if file_path.exists():
+                    file_path.unlink()
+            except Exception as e:
+                logger.error(f"ファイル削除エラー: {e}")
         
         # メタデータから削除
         del metadata[voice_id]
-        self._save_metadata(metadata)
+        self._user_index[user_id].remove(voice_id)
+        self._record_op({"op": "del", "voice_id": voice_id})
         
         return True
     
@@ -194,7 +498,7 @@ class VoiceManager:
     
     def get_storage_stats(self) -> Dict:
         """ストレージ使用状況を取得"""
-        metadata = self._load_metadata()
+        metadata = self._get_metadata()
         total_files = len(metadata)
         total_size = sum(voice.get("file_size", 0) for voice in metadata.values())
         
@@ -3,32 +3,188 @@
 音声プロファイルとクローンデータの安全な管理
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import aiofiles
 import shutil
+import time
+import numpy as np
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from datetime import datetime
 import uuid
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# ジャーナルがこのサイズ未満ならコンパクションしない
+METADATA_JOURNAL_MIN_COMPACT_BYTES = 64 * 1024
+
+# プロファイル一覧取得時の同時ファイル読み込み数の上限
+PROFILE_READ_CONCURRENCY = 32
+
+# ストレージ統計のキャッシュ有効期間（秒）。ポーリングされるエンドポイント向け
+STORAGE_STATS_TTL = 5.0
+
+# 既定のストレージパス（backend/storage/voices）。インスタンス生成ごとのresolveを避ける
+_BACKEND_ROOT = Path(__file__).resolve().parents[1]  # backend/services -> backend
+_DEFAULT_FALLBACK = str(_BACKEND_ROOT / "storage" / "voices")
+
+# 旧コンテナ環境で保存されたプロファイルの参照音声パスの接頭辞
+CONTAINER_STORAGE_PREFIX = "/app/storage/voices"
+
+# コンテナパスの移行を済ませたストレージルート（インスタンス生成ごとの走査を避ける）
+_MIGRATED_ROOTS: set = set()
+
+# profile.jsonのパース結果キャッシュ: パス -> ((mtime_ns, size), データ)
+# ルーターはリクエストごとにサービスを生成するためモジュール全体で共有する
+_PROFILE_CACHE: Dict[str, tuple] = {}
+
+# 作成済みを確認したディレクトリ（プロセス全体で共有、削除時は_forget_dirで除外）
+_ENSURED_DIRS: set = set()
+
+# メタデータのメモリ上の内容: メタデータファイルパス -> (ディスク署名, メタデータ)
+# スナップショット + ジャーナル再生の結果をリクエストをまたいで共有する
+_METADATA_CACHE: Dict[str, tuple] = {}
+
+# get_storage_statsの結果キャッシュ: ストレージルート -> (monotonic時刻, 統計)
+_STATS_CACHE: Dict[str, tuple] = {}
+
+# profile.json同時読み込み数の制限（fd枯渇防止）: イベントループ -> セマフォ
+# asyncioのプリミティブは別のループで使えないため、ループごとに遅延生成して
+# 同じループ上のリクエストをまたいで共有する
+_PROFILE_READ_SEMS: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+
+def _apply_journal_row(metadata: Dict, row: Dict) -> None:
+    """ジャーナルの1操作をメタデータに適用"""
+    if row.get("op") == "put":
+        metadata["profiles"][row["id"]] = row["meta"]
+    elif row.get("op") == "del":
+        metadata["profiles"].pop(row["id"], None)
+
+
+def _copy_stats(stats: Dict) -> Dict:
+    """キャッシュした統計のコピー（ネストしたstorage_sizeも複製）"""
+    return {**stats, "storage_size": dict(stats["storage_size"])}
+
+
+def _ensure_dir(path: str) -> None:
+    """ディレクトリを作成（確認済みならシステムコールを発行しない）"""
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
+
+def _profile_read_semaphore() -> asyncio.Semaphore:
+    """実行中のイベントループ用の読み込みセマフォを取得（初回に生成）"""
+    loop = asyncio.get_running_loop()
+    sem = _PROFILE_READ_SEMS.get(loop)
+    if sem is None:
+        # 終了したループ（asyncio.runやテストごとのループ）の分は捨てる
+        for closed in [l for l in _PROFILE_READ_SEMS if l.is_closed()]:
+            del _PROFILE_READ_SEMS[closed]
+        sem = _PROFILE_READ_SEMS[loop] = asyncio.Semaphore(PROFILE_READ_CONCURRENCY)
+    return sem
+
+
+def _forget_dir(path: str) -> None:
+    """削除したディレクトリ（とその配下）を作成済みの記録から外す"""
+    prefix = path + os.sep
+    for ensured in [d for d in _ENSURED_DIRS if d == path or d.startswith(prefix)]:
+        _ENSURED_DIRS.discard(ensured)
+
+
+def _dir_size(path: str) -> int:
+    """ディレクトリ配下の合計サイズ（os.scandirのDirEntry.statでsyscallを抑える）"""
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except FileNotFoundError:
+                        # 走査中に削除されたファイル
+                        continue
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return total
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """同じディレクトリの一時ファイル(O_EXCL)に書いてからos.replaceで置き換える"""
+    directory, name = os.path.split(path)
+    temp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_bytes(path: str) -> bytes:
+    """ファイル全体をバイト列で読み込む"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _iso_now() -> str:
+    """現在時刻のISO 8601文字列（秒精度、ローカル時刻）
+    
+    datetimeオブジェクトを生成せずtime.strftimeで整形する。
+    ルーター側で付与されるcreated_at（ローカル時刻）と揃えるためUTCにはしない
+    """
+    return time.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """JSONバイト列へのシリアライズ（orjsonが無ければ標準json）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """JSONバイト列のパース（orjsonが無ければ標準json）"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
 class VoiceStorageService:
     """音声プロファイルとクローンデータの管理サービス"""
     
+    __slots__ = (
+        "storage_root", "profiles_dir", "embeddings_dir", "samples_dir",
+        "metadata_file", "metadata_journal",
+        "_profiles_dir_str", "_embeddings_dir_str", "_samples_dir_str",
+        "_metadata_file_str", "_metadata_journal_str",
+    )
+    
     def __init__(self, storage_root: str = None):
         # 【Springfield改良】環境変数による統合パス管理システム
         if storage_root is None:
             from core.environment_config import env_config
             
             # 環境設定から取得
-            current_file = Path(__file__).resolve()
-            backend_root = current_file.parents[1]  # backend/services -> backend
-            fallback_path = str(backend_root / "storage" / "voices")
-            
-            storage_root = env_config.get_storage_path(fallback_path)
+            storage_root = env_config.get_storage_path(_DEFAULT_FALLBACK)
             
             # デバッグ情報の出力
             if env_config.debug_mode:
@@ -45,24 +201,94 @@ class VoiceStorageService:
         self.embeddings_dir = self.storage_root / "embeddings"
         self.samples_dir = self.storage_root / "samples"
         self.metadata_file = self.storage_root / "voices_metadata.json"
+        # メタデータ変更ジャーナル（1行1操作のJSON Lines）。スナップショットに再生して使う
+        self.metadata_journal = self.storage_root / "voices_metadata.jsonl"
+        
+        # ホットパスでのPath生成を避けるため文字列パスを保持
+        self._profiles_dir_str = str(self.profiles_dir)
+        self._embeddings_dir_str = str(self.embeddings_dir)
+        self._samples_dir_str = str(self.samples_dir)
+        self._metadata_file_str = str(self.metadata_file)
+        self._metadata_journal_str = str(self.metadata_journal)
         
         logger.info(f"VoiceStorageService初期化: {self.storage_root}")
         
         # ディレクトリ作成
         self._ensure_directories()
+        
+        # 保存済みプロファイルのコンテナパスをローカルパスへ一度だけ書き換える
+        if str(self.storage_root) not in _MIGRATED_ROOTS:
+            self._migrate_container_paths()
+            _MIGRATED_ROOTS.add(str(self.storage_root))
+    
+    def _localize_path(self, path: Optional[str]) -> Optional[str]:
+        """コンテナ内パス(/app/storage/voices/...)を実際のストレージパスに変換
+        
+        変換先が存在しない場合は元のパスを返す
+        """
+        if not path or not path.startswith(CONTAINER_STORAGE_PREFIX):
+            return path
+        local_path = str(self.storage_root) + path[len(CONTAINER_STORAGE_PREFIX):]
+        if local_path == path:
+            return path
+        if not os.path.exists(local_path):
+            logger.warning(f"参照音声ファイルが見つかりません: {local_path}")
+            return path
+        logger.info(f"パス正規化: {path} -> {local_path}")
+        return local_path
+    
+    def _migrate_container_paths(self):
+        """profile.jsonとメタデータに残るコンテナ内パスを書き換える（起動時に一度）"""
+        if str(self.storage_root) == CONTAINER_STORAGE_PREFIX:
+            return
+        prefix = CONTAINER_STORAGE_PREFIX.encode()
+        try:
+            with os.scandir(self._profiles_dir_str) as it:
+                entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return
+        
+        for entry in entries:
+            profile_file = os.path.join(entry.path, "profile.json")
+            try:
+                content = _read_bytes(profile_file)
+                # 大半のプロファイルはパースせずに判定できる
+                if prefix not in content:
+                    continue
+                profile_data = _json_loads(content)
+                original_path = profile_data.get("reference_audio_path")
+                local_path = self._localize_path(original_path)
+                if local_path == original_path:
+                    continue
+                profile_data["reference_audio_path"] = local_path
+                _atomic_write(profile_file, _json_dumps(profile_data, indent=True))
+                
+                meta = self._read_metadata()["profiles"].get(entry.name)
+                if meta is not None and meta.get("reference_audio_path") == original_path:
+                    self._append_journal({
+                        "op": "put",
+                        "id": entry.name,
+                        "meta": {**meta, "reference_audio_path": local_path},
+                        "ts": _iso_now()
+                    })
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.error(f"プロファイルパス移行エラー ({entry.name}): {str(e)}")
     
     def _ensure_directories(self):
         """必要なディレクトリを作成"""
         try:
-            for directory in [self.storage_root, self.profiles_dir, 
-                             self.embeddings_dir, self.samples_dir]:
-                directory.mkdir(parents=True, exist_ok=True)
+            # storage_rootは各サブディレクトリ作成時に合わせて作られる
+            for directory in (self._profiles_dir_str, self._embeddings_dir_str,
+                              self._samples_dir_str):
+                _ensure_dir(directory)
             
             # メタデータファイル初期化
             if not self.metadata_file.exists():
                 self._write_metadata({
                     "version": "1.0",
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": _iso_now(),
                     "profiles": {}
                 })
                 
@@ -75,38 +301,131 @@ class VoiceStorageService:
         try:
             # 一時ファイルに書き込んでから置き換える（アトミック操作）
             temp_file = self.metadata_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            buf = _json_dumps(data, indent=True)
+            with open(temp_file, 'wb') as f:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # 書き込み確認はデバッグ時のみ、置き換え前の一時ファイルに対して行う
+            if logger.isEnabledFor(logging.DEBUG):
+                with open(temp_file, 'rb') as f:
+                    if hashlib.sha256(f.read()).digest() != hashlib.sha256(buf).digest():
+                        raise IOError(f"メタデータ一時ファイルの検証に失敗: {temp_file}")
             
             # ファイルを置き換え
             temp_file.replace(self.metadata_file)
             logger.info(f"メタデータファイル更新完了: {self.metadata_file}")
             
-            # 書き込み確認
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                saved_data = json.load(f)
-                if profile_id := data.get('profiles', {}):
-                    for pid in profile_id:
-                        if pid in saved_data.get('profiles', {}):
-                            logger.info(f"プロファイル {pid} の保存を確認")
-                        else:
-                            logger.error(f"プロファイル {pid} の保存に失敗")
-                            
         except Exception as e:
             logger.error(f"メタデータ書き込みエラー: {str(e)}")
             raise
     
-    def _read_metadata(self) -> Dict:
-        """メタデータファイルを読み込み"""
+    def _load_metadata(self) -> Dict:
+        """メタデータの読み込み（スナップショット + ジャーナルの再生）"""
         try:
-            if not self.metadata_file.exists():
-                return {"version": "1.0", "profiles": {}}
-            
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self._metadata_file_str, 'rb') as f:
+                metadata = _json_loads(f.read())
+        except FileNotFoundError:
+            metadata = {"version": "1.0", "profiles": {}}
         except Exception as e:
             logger.error(f"メタデータ読み込みエラー: {str(e)}")
-            return {"version": "1.0", "profiles": {}}
+            metadata = {"version": "1.0", "profiles": {}}
+        
+        # profilesキーが存在しない場合は初期化
+        metadata.setdefault("profiles", {})
+        
+        try:
+            with open(self._metadata_journal_str, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        row = _json_loads(line)
+                    except json.JSONDecodeError:
+                        # 書き込み途中で中断された末尾行
+                        logger.warning(f"メタデータジャーナルの不完全な行をスキップ: {self.metadata_journal}")
+                        break
+                    _apply_journal_row(metadata, row)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"メタデータジャーナル読み込みエラー: {str(e)}")
+        
+        return metadata
+    
+    def _disk_signature(self) -> tuple:
+        """スナップショットとジャーナルの(mtime_ns, size)"""
+        signature = []
+        for path in (self._metadata_file_str, self._metadata_journal_str):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def _read_metadata(self) -> Dict:
+        """
+        メタデータを取得（メモリ上の内容を返す）
+        
+        スナップショット + ジャーナル再生の結果はモジュール全体で共有し、
+        ファイルの(mtime_ns, size)が変わった場合のみ再読み込みする。
+        戻り値はキャッシュそのものなので呼び出し側で変更しないこと。
+        """
+        signature = self._disk_signature()
+        cached = _METADATA_CACHE.get(self._metadata_file_str)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        metadata = self._load_metadata()
+        _METADATA_CACHE[self._metadata_file_str] = (signature, metadata)
+        return metadata
+    
+    def _append_journal(self, row: Dict):
+        """
+        メタデータジャーナルに1操作を追記し、メモリ上のメタデータに反映（必要ならコンパクション）
+        
+        共有キャッシュは書き込みが成功してから更新するため、失敗時に
+        永続化されていない変更が他のリクエストから見えることはない。
+        """
+        metadata = self._read_metadata()
+        try:
+            data = _json_dumps(row) + b"\n"
+            with open(self._metadata_journal_str, 'ab') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            logger.error(f"メタデータジャーナル書き込みエラー: {str(e)}")
+            raise
+        
+        _apply_journal_row(metadata, row)
+        if self._needs_compaction():
+            self._compact_journal(metadata)
+        # プロファイルの増減を統計に反映させる
+        _STATS_CACHE.pop(str(self.storage_root), None)
+        # 自身の書き込みでは再読み込み不要
+        _METADATA_CACHE[self._metadata_file_str] = (self._disk_signature(), metadata)
+    
+    def _needs_compaction(self) -> bool:
+        """ジャーナルがスナップショットの2倍を超えたらコンパクションする"""
+        try:
+            journal_size = os.stat(self._metadata_journal_str).st_size
+        except FileNotFoundError:
+            return False
+        try:
+            snapshot_size = os.stat(self._metadata_file_str).st_size
+        except FileNotFoundError:
+            snapshot_size = 0
+        return journal_size > max(2 * snapshot_size, METADATA_JOURNAL_MIN_COMPACT_BYTES)
+    
+    def _compact_journal(self, metadata: Dict):
+        """現在のメタデータをスナップショットに書き出し、ジャーナルを空にする"""
+        self._write_metadata(metadata)
+        # ジャーナルの操作は冪等なので、ここで中断しても再生結果は変わらない
+        with open(self._metadata_journal_str, 'wb'):
+            pass
+        logger.info(f"メタデータジャーナルをコンパクション: {self.metadata_file}")
     
     async def save_voice_profile(
         self, 
@@ -116,46 +435,51 @@ class VoiceStorageService:
         """音声プロファイルを保存"""
         try:
             # プロファイルディレクトリ作成
-            profile_dir = self.profiles_dir / profile_id
-            profile_dir.mkdir(exist_ok=True)
+            profile_dir = os.path.join(self._profiles_dir_str, profile_id)
+            _ensure_dir(profile_dir)
             
             # プロファイルデータファイル
-            profile_file = profile_dir / "profile.json"
+            profile_file = os.path.join(profile_dir, "profile.json")
             
-            # データに追加情報を付与
+            # データに追加情報を付与（参照音声パスは保存時に正規化しておく）
             enhanced_data = {
                 **profile_data,
-                "storage_path": str(profile_dir),
-                "updated_at": datetime.now().isoformat()
+                "storage_path": profile_dir,
+                "updated_at": _iso_now()
             }
-            
-            # プロファイルファイルを保存
-            async with aiofiles.open(profile_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(enhanced_data, ensure_ascii=False, indent=2))
-            
-            # メタデータを更新
-            metadata = self._read_metadata()
-            
-            # profilesキーが存在しない場合は初期化
-            if "profiles" not in metadata:
-                metadata["profiles"] = {}
-                
-            metadata["profiles"][profile_id] = {
+            if "reference_audio_path" in enhanced_data:
+                enhanced_data["reference_audio_path"] = self._localize_path(
+                    enhanced_data["reference_audio_path"]
+                )
+            
+            # プロファイルファイルを保存（小さいファイルなので1回のスレッド実行で書き込む）
+            await asyncio.to_thread(
+                _atomic_write, profile_file, _json_dumps(enhanced_data, indent=True)
+            )
+            _PROFILE_CACHE.pop(profile_file, None)
+            
+            # メタデータを更新（メモリ上の内容はジャーナル追記の成功後に反映される）
+            meta = {
                 "name": profile_data.get("name"),
                 "provider": profile_data.get("provider"),
                 "status": profile_data.get("status"),
                 "created_at": profile_data.get("created_at"),
                 "updated_at": enhanced_data["updated_at"],
-                "storage_path": str(profile_dir),
-                "reference_audio_path": profile_data.get("reference_audio_path"),
+                "storage_path": profile_dir,
+                "reference_audio_path": enhanced_data.get("reference_audio_path"),
                 "embedding_path": profile_data.get("embedding_path")
             }
             
-            logger.info(f"メタデータ更新: プロファイルID={profile_id}, パス={self.metadata_file}")
-            self._write_metadata(metadata)
+            logger.info(f"メタデータ更新: プロファイルID={profile_id}, パス={self.metadata_journal}")
+            self._append_journal({
+                "op": "put",
+                "id": profile_id,
+                "meta": meta,
+                "ts": enhanced_data["updated_at"]
+            })
             
             logger.info(f"音声プロファイル保存完了: {profile_id}")
-            return str(profile_file)
+            return profile_file
             
         except Exception as e:
             logger.error(f"プロファイル保存エラー: {str(e)}")
@@ -164,48 +488,61 @@ class VoiceStorageService:
     async def get_voice_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
         """音声プロファイルを取得"""
         try:
-            profile_file = self.profiles_dir / profile_id / "profile.json"
+            profile_file = os.path.join(self._profiles_dir_str, profile_id, "profile.json")
             
-            if not profile_file.exists():
+            try:
+                st = os.stat(profile_file)
+            except FileNotFoundError:
+                _PROFILE_CACHE.pop(profile_file, None)
                 return None
             
-            async with aiofiles.open(profile_file, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                profile_data = json.loads(content)
-                
-                # 【緊急修正】パス正規化 - コンテナ内パスを実際のパスに変換
-                if 'reference_audio_path' in profile_data:
-                    original_path = profile_data['reference_audio_path']
-                    if original_path and original_path.startswith('/app/storage'):
-                        # /app/storage -> 実際のプロジェクトディレクトリに変換
-                        local_path = original_path.replace('/app/storage/voices', str(self.storage_root))
-                        if Path(local_path).exists():
-                            profile_data['reference_audio_path'] = local_path
-                            logger.info(f"パス正規化: {original_path} -> {local_path}")
-                        else:
-                            logger.warning(f"参照音声ファイルが見つかりません: {local_path}")
-                
-                return profile_data
+            # ファイルが変わっていなければパース済みの結果を返す（呼び出し側の変更に備えてコピー）
+            signature = (st.st_mtime_ns, st.st_size)
+            cached = _PROFILE_CACHE.get(profile_file)
+            if cached is not None and cached[0] == signature:
+                return dict(cached[1])
+            
+            try:
+                content = await asyncio.to_thread(_read_bytes, profile_file)
+            except FileNotFoundError:
+                _PROFILE_CACHE.pop(profile_file, None)
+                return None
+            
+            # コンテナパスの正規化は保存時と起動時の移行で済ませている
+            profile_data = _json_loads(content)
+            _PROFILE_CACHE[profile_file] = (signature, profile_data)
+            
+            return dict(profile_data)
                 
         except Exception as e:
             logger.error(f"プロファイル取得エラー: {str(e)}")
             return None
     
+    def get_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """メタデータ（スナップショット + ジャーナル）上のプロファイル概要を取得"""
+        profile = self._read_metadata().get("profiles", {}).get(profile_id)
+        # メモリ上のメタデータを共有しているため呼び出し側にはコピーを返す
+        return dict(profile) if profile is not None else None
+    
     async def get_all_voice_profiles(self, provider: Optional[str] = None) -> List[Dict[str, Any]]:
         """全音声プロファイルを取得"""
         try:
-            profiles = []
             metadata = self._read_metadata()
+            profile_ids = [
+                profile_id
+                for profile_id, profile_meta in metadata["profiles"].items()
+                if not provider or profile_meta.get("provider") == provider
+            ]
             
-            for profile_id, profile_meta in metadata["profiles"].items():
-                if provider and profile_meta.get("provider") != provider:
-                    continue
-                
-                profile_data = await self.get_voice_profile(profile_id)
-                if profile_data:
-                    profiles.append(profile_data)
+            read_sem = _profile_read_semaphore()
+            
+            async def bounded_get(profile_id: str) -> Optional[Dict[str, Any]]:
+                async with read_sem:
+                    return await self.get_voice_profile(profile_id)
             
-            return profiles
+            # 各プロファイルの読み込みは独立しているので並行実行する（順序は維持）
+            results = await asyncio.gather(*(bounded_get(pid) for pid in profile_ids))
+            return [profile_data for profile_data in results if profile_data]
             
         except Exception as e:
             logger.error(f"プロファイル一覧取得エラー: {str(e)}")
@@ -231,24 +568,30 @@ class VoiceStorageService:
             if profile_dir.exists():
                 logger.info(f"プロファイルディレクトリ削除: {profile_dir}")
                 shutil.rmtree(profile_dir)
+                _forget_dir(str(profile_dir))
+                _PROFILE_CACHE.pop(os.path.join(str(profile_dir), "profile.json"), None)
                 deleted_files = True
             
             # メタデータから削除
             if profile_id in metadata.get("profiles", {}):
                 # 埋め込みパスを保存
                 embedding_path = metadata["profiles"][profile_id].get("embedding_path")
-                del metadata["profiles"][profile_id]
-                self._write_metadata(metadata)
+                self._append_journal({
+                    "op": "del",
+                    "id": profile_id,
+                    "ts": _iso_now()
+                })
                 logger.info(f"メタデータからプロファイル削除: {profile_id}")
             
-            # 関連する埋め込みファイルも削除
-            embedding_file = self.embeddings_dir / f"{profile_id}.pt"
-            if embedding_file.exists():
-                embedding_file.unlink()
-                logger.info(f"埋め込みファイル削除: {embedding_file}")
+            # 関連する埋め込みファイルも削除（旧形式.ptと配列形式.npy）
+            for suffix in (".pt", ".npy"):
+                embedding_file = os.path.join(self._embeddings_dir_str, f"{profile_id}{suffix}")
+                if os.path.exists(embedding_file):
+                    os.unlink(embedding_file)
+                    logger.info(f"埋め込みファイル削除: {embedding_file}")
             
             # ファイルもメタデータも削除されたか、またはメタデータから削除された場合は成功
-            if deleted_files or profile_id not in metadata.get("profiles", {}):
+            if deleted_files or profile_id not in self._read_metadata().get("profiles", {}):
                 logger.info(f"音声プロファイル削除完了: {profile_id}")
                 return True
             else:
@@ -266,13 +609,12 @@ class VoiceStorageService:
     ) -> str:
         """音声埋め込みデータを保存"""
         try:
-            embedding_file = self.embeddings_dir / f"{profile_id}.pt"
+            embedding_file = os.path.join(self._embeddings_dir_str, f"{profile_id}.pt")
             
-            async with aiofiles.open(embedding_file, 'wb') as f:
-                await f.write(embedding_data)
+            await asyncio.to_thread(_atomic_write, embedding_file, embedding_data)
             
             logger.info(f"音声埋め込み保存完了: {profile_id}")
-            return str(embedding_file)
+            return embedding_file
             
         except Exception as e:
             logger.error(f"埋め込み保存エラー: {str(e)}")
@@ -281,9 +623,9 @@ class VoiceStorageService:
     async def get_voice_embedding(self, profile_id: str) -> Optional[bytes]:
         """音声埋め込みデータを取得"""
         try:
-            embedding_file = self.embeddings_dir / f"{profile_id}.pt"
+            embedding_file = os.path.join(self._embeddings_dir_str, f"{profile_id}.pt")
             
-            if not embedding_file.exists():
+            if not os.path.exists(embedding_file):
                 return None
             
             async with aiofiles.open(embedding_file, 'rb') as f:
@@ -293,6 +635,48 @@ class VoiceStorageService:
             logger.error(f"埋め込み取得エラー: {str(e)}")
             return None
     
+    async def save_voice_embedding_array(
+        self,
+        profile_id: str,
+        embedding: np.ndarray,
+        dtype: Any = np.float16
+    ) -> str:
+        """
+        音声埋め込みベクトルを.npy形式で保存
+        
+        pickle形式(.pt)と異なり、読み込み時にmmapで参照できる。
+        既定ではfloat16に変換して保存する（サイズ半減）。
+        """
+        try:
+            embedding_file = os.path.join(self._embeddings_dir_str, f"{profile_id}.npy")
+            array = np.ascontiguousarray(embedding, dtype=dtype)
+            await asyncio.to_thread(np.save, embedding_file, array)
+            
+            logger.info(f"音声埋め込み保存完了: {profile_id} (shape={array.shape}, dtype={array.dtype})")
+            return embedding_file
+            
+        except Exception as e:
+            logger.error(f"埋め込み保存エラー: {str(e)}")
+            raise
+    
+    async def get_voice_embedding_array(self, profile_id: str) -> Optional[np.ndarray]:
+        """
+        .npy形式の音声埋め込みベクトルを読み取り専用mmapで取得
+        
+        旧形式(.pt)の埋め込みはget_voice_embeddingでバイト列として取得する。
+        """
+        try:
+            embedding_file = os.path.join(self._embeddings_dir_str, f"{profile_id}.npy")
+            
+            if not os.path.exists(embedding_file):
+                return None
+            
+            return await asyncio.to_thread(np.load, embedding_file, mmap_mode='r')
+                
+        except Exception as e:
+            logger.error(f"埋め込み取得エラー: {str(e)}")
+            return None
+    
     async def save_audio_samples(
         self, 
         profile_id: str, 
@@ -301,20 +685,20 @@ class VoiceStorageService:
     ) -> List[str]:
         """音声サンプルファイルを保存"""
         try:
-            sample_dir = self.samples_dir / profile_id
-            sample_dir.mkdir(exist_ok=True)
+            sample_dir = os.path.join(self._samples_dir_str, profile_id)
+            _ensure_dir(sample_dir)
             
-            saved_paths = []
+            # 安全なファイル名に変換（元のfilenamesは使わない）
+            saved_paths = [
+                os.path.join(sample_dir, f"sample_{i:02d}_{uuid.uuid4().hex[:8]}.wav")
+                for i in range(min(len(audio_files), len(filenames)))
+            ]
             
-            for i, (audio_data, filename) in enumerate(zip(audio_files, filenames)):
-                # 安全なファイル名に変換
-                safe_filename = f"sample_{i:02d}_{uuid.uuid4().hex[:8]}.wav"
-                sample_file = sample_dir / safe_filename
-                
-                async with aiofiles.open(sample_file, 'wb') as f:
-                    await f.write(audio_data)
-                
-                saved_paths.append(str(sample_file))
+            # 各サンプルは独立しているので並行して書き込む
+            await asyncio.gather(*(
+                asyncio.to_thread(_atomic_write, sample_file, audio_data)
+                for sample_file, audio_data in zip(saved_paths, audio_files)
+            ))
             
             logger.info(f"音声サンプル保存完了: {profile_id} ({len(saved_paths)}ファイル)")
             return saved_paths
@@ -326,19 +710,36 @@ class VoiceStorageService:
     async def get_storage_stats(self) -> Dict[str, Any]:
         """ストレージ使用状況を取得"""
         try:
-            def get_dir_size(directory: Path) -> int:
-                """ディレクトリサイズを取得"""
-                total_size = 0
-                if directory.exists():
-                    for dirpath, dirnames, filenames in os.walk(directory):
-                        for filename in filenames:
-                            filepath = os.path.join(dirpath, filename)
-                            if os.path.exists(filepath):
-                                total_size += os.path.getsize(filepath)
-                return total_size
+            now = time.monotonic()
+            root = str(self.storage_root)
+            cached = _STATS_CACHE.get(root)
+            if cached is not None and now - cached[0] < STORAGE_STATS_TTL:
+                # リクエスト間で共有しているため呼び出し側の変更に備えてコピーを返す
+                return _copy_stats(cached[1])
             
             metadata = self._read_metadata()
             
+            # 各サブディレクトリを一度ずつ走査し、合計はルート直下の残りを足して求める
+            storage_root = str(self.storage_root)
+            sizes = {
+                "profiles": _dir_size(self._profiles_dir_str),
+                "embeddings": _dir_size(self._embeddings_dir_str),
+                "samples": _dir_size(self._samples_dir_str),
+            }
+            counted = {self._profiles_dir_str, self._embeddings_dir_str, self._samples_dir_str}
+            rest = 0
+            try:
+                with os.scandir(storage_root) as it:
+                    for entry in it:
+                        if entry.path in counted:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            rest += _dir_size(entry.path)
+                        else:
+                            rest += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                pass
+            
             stats = {
                 "total_profiles": len(metadata["profiles"]),
                 "active_profiles": len([
@@ -346,15 +747,14 @@ class VoiceStorageService:
                     if p.get("status") == "ready"
                 ]),
                 "storage_size": {
-                    "profiles": get_dir_size(self.profiles_dir),
-                    "embeddings": get_dir_size(self.embeddings_dir),
-                    "samples": get_dir_size(self.samples_dir),
-                    "total": get_dir_size(self.storage_root)
+                    **sizes,
+                    "total": sum(sizes.values()) + rest
                 },
-                "last_updated": datetime.now().isoformat()
+                "last_updated": _iso_now()
             }
             
-            return stats
+            _STATS_CACHE[root] = (now, stats)
+            return _copy_stats(stats)
             
         except Exception as e:
             logger.error(f"ストレージ統計エラー: {str(e)}")
@@ -364,7 +764,7 @@ class VoiceStorageService:
         """孤立したファイルをクリーンアップ"""
         try:
             metadata = self._read_metadata()
-            active_profiles = set(metadata["profiles"].keys())
+            active_profiles = frozenset(metadata["profiles"])
             
             cleaned = {
                 "profiles": 0,
@@ -372,27 +772,28 @@ class VoiceStorageService:
                 "samples": 0
             }
             
-            # 孤立したプロファイルディレクトリを削除
-            if self.profiles_dir.exists():
-                for profile_dir in self.profiles_dir.iterdir():
-                    if profile_dir.is_dir() and profile_dir.name not in active_profiles:
-                        shutil.rmtree(profile_dir)
-                        cleaned["profiles"] += 1
-            
-            # 孤立した埋め込みファイルを削除
-            if self.embeddings_dir.exists():
-                for embedding_file in self.embeddings_dir.glob("*.pt"):
-                    profile_id = embedding_file.stem
-                    if profile_id not in active_profiles:
-                        embedding_file.unlink()
-                        cleaned["embeddings"] += 1
-            
-            # 孤立したサンプルディレクトリを削除
-            if self.samples_dir.exists():
-                for sample_dir in self.samples_dir.iterdir():
-                    if sample_dir.is_dir() and sample_dir.name not in active_profiles:
-                        shutil.rmtree(sample_dir)
-                        cleaned["samples"] += 1
+            def scan(directory: str) -> List[os.DirEntry]:
+                try:
+                    with os.scandir(directory) as it:
+                        return list(it)
+                except FileNotFoundError:
+                    return []
+            
+            # 孤立したプロファイル・サンプルディレクトリを削除
+            for key, directory in (("profiles", self._profiles_dir_str),
+                                   ("samples", self._samples_dir_str)):
+                for entry in scan(directory):
+                    if entry.name not in active_profiles and entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                        _forget_dir(entry.path)
+                        cleaned[key] += 1
+            
+            # 孤立した埋め込みファイルを削除（旧形式.ptと配列形式.npy）
+            for entry in scan(self._embeddings_dir_str):
+                profile_id, suffix = os.path.splitext(entry.name)
+                if suffix in (".pt", ".npy") and profile_id not in active_profiles:
+                    os.unlink(entry.path)
+                    cleaned["embeddings"] += 1
             
             logger.info(f"クリーンアップ完了: {cleaned}")
             return cleaned
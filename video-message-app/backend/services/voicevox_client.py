@@ -8,17 +8,86 @@ import asyncio
 import json
 import base64
 import io
+import logging
+import os
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 import aiofiles
 
+try:
+    import h2  # noqa: F401  httpxのHTTP/2サポートに必要
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# batch_synthesisでVOICEVOX Engineへ同時に送るリクエスト数
+BATCH_SYNTHESIS_CONCURRENCY = int(os.getenv('VOICEVOX_CONCURRENCY', '4'))
+
+# synthesis_to_fileでファイルへ書き出す単位（バイト）
+SYNTHESIS_CHUNK_SIZE = 64 * 1024
+
+# 人気の話者（style_id -> 推奨順）
+POPULAR_SPEAKER_ORDER: Dict[int, int] = {
+    style_id: order
+    for order, style_id in enumerate([
+        1,  # 四国めたん（ノーマル）
+        3,  # 春日部つむぎ（ノーマル）
+        2,  # ずんだもん（ノーマル）
+        20, # もち子さん（ノーマル）
+        8,  # 春日部つむぎ（ささやき）
+        10, # 雨晴はう（ノーマル）
+        14, # 冥鳴ひまり（ノーマル）
+        16, # No.7（ノーマル）
+    ])
+}
+
+# estimate_speech_timeの結果キャッシュ上限（(speaker_id, text)単位のLRU）
+ESTIMATE_CACHE_MAX_ENTRIES = 4096
+
+# fast=Trueのとき、この文字数未満はaudio_queryを呼ばず文字数ベースで推定する
+ESTIMATE_FAST_PATH_MAX_CHARS = 40
+
+# 文字数ベース推定の発話速度（日本語: 約3文字/秒）
+ESTIMATE_CHARS_PER_SECOND = 3.0
+
+# VOICEVOX Engineへの接続設定（合成は長文で時間がかかるため読み取りは長め）
+VOICEVOX_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+VOICEVOX_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+
+# (speaker_id, text) -> 推定発話時間（秒）
+# ルーターはリクエスト毎にクライアントを作るため、インスタンスではなくモジュールで共有する
+_ESTIMATE_CACHE: "OrderedDict[tuple, float]" = OrderedDict()
+
 class VOICEVOXClient:
     """VOICEVOX Engine APIクライアント"""
     
+    __slots__ = (
+        "base_url", "client", "_speakers_cache", "_speakers_index",
+        "_speakers_fetched_at", "_speakers_etag",
+    )
+    
+    # 話者一覧キャッシュの有効期間（秒）。期限切れ後はETagで条件付き再取得する
+    SPEAKERS_CACHE_TTL = 300.0
+    
     def __init__(self, base_url: str = "http://localhost:50021"):
         self.base_url = base_url.rstrip('/')
-        self.client = httpx.AsyncClient()
+        # base_urlを設定して各リクエストは相対パスで送る。
+        # Accept-Encodingはhttpxの既定（インストール済みのデコーダのみ）に任せる
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=VOICEVOX_TIMEOUT,
+            limits=VOICEVOX_LIMITS,
+        )
         self._speakers_cache: Optional[List[Dict]] = None
+        # style_id -> 話者情報（get_speaker_info用の索引）
+        self._speakers_index: Dict[int, Dict] = {}
+        self._speakers_fetched_at: float = 0.0
+        self._speakers_etag: Optional[str] = None
         
     async def __aenter__(self):
         return self
@@ -29,7 +98,7 @@ class VOICEVOXClient:
     async def health_check(self) -> Dict[str, str]:
         """VOICEVOX Engineのヘルスチェック"""
         try:
-            response = await self.client.get(f"{self.base_url}/version")
+            response = await self.client.get("/version")
             response.raise_for_status()
             return {"status": "healthy", "version": response.text.strip('"')}
         except Exception as e:
@@ -37,34 +106,60 @@ class VOICEVOXClient:
     
     async def get_speakers(self) -> List[Dict]:
         """利用可能な話者一覧を取得"""
-        if self._speakers_cache is None:
-            try:
-                response = await self.client.get(f"{self.base_url}/speakers")
-                response.raise_for_status()
-                self._speakers_cache = response.json()
-            except Exception as e:
-                raise Exception(f"話者情報の取得に失敗: {str(e)}")
+        if (
+            self._speakers_cache is not None
+            and time.monotonic() - self._speakers_fetched_at < self.SPEAKERS_CACHE_TTL
+        ):
+            return self._speakers_cache
+        
+        headers = {}
+        if self._speakers_cache is not None and self._speakers_etag:
+            headers['If-None-Match'] = self._speakers_etag
+        
+        try:
+            response = await self.client.get("/speakers", headers=headers)
+            if response.status_code == 304 and self._speakers_cache is not None:
+                # 変更なし: キャッシュの有効期限のみ延長
+                self._speakers_fetched_at = time.monotonic()
+                return self._speakers_cache
+            response.raise_for_status()
+            speakers = response.json()
+        except Exception as e:
+            if self._speakers_cache is not None:
+                # 再取得に失敗しても取得済みの一覧で継続する
+                return self._speakers_cache
+            raise Exception(f"話者情報の取得に失敗: {str(e)}")
+        
+        self._speakers_cache = speakers
+        self._speakers_etag = response.headers.get('etag')
+        self._speakers_fetched_at = time.monotonic()
+        self._speakers_index = {
+            style.get('id'): {
+                'speaker_name': speaker.get('name'),
+                'speaker_uuid': speaker.get('speaker_uuid'),
+                'style_name': style.get('name'),
+                'style_id': style.get('id'),
+                'version': speaker.get('version')
+            }
+            for speaker in speakers
+            for style in speaker.get('styles', [])
+        }
         
         return self._speakers_cache
     
     async def get_speaker_info(self, speaker_id: int) -> Optional[Dict]:
         """特定の話者情報を取得"""
-        speakers = await self.get_speakers()
+        await self.get_speakers()
         
-        for speaker in speakers:
-            for style in speaker.get('styles', []):
-                if style.get('id') == speaker_id:
-                    return {
-                        'speaker_name': speaker.get('name'),
-                        'speaker_uuid': speaker.get('speaker_uuid'),
-                        'style_name': style.get('name'),
-                        'style_id': style.get('id'),
-                        'version': speaker.get('version')
-                    }
-        return None
+        info = self._speakers_index.get(speaker_id)
+        return dict(info) if info is not None else None
     
     async def audio_query(self, text: str, speaker_id: int) -> Dict:
         """音声クエリを生成（音声合成の前処理）"""
+        return json.loads(await self._audio_query_raw(text, speaker_id))
+    
+    async def _audio_query_raw(self, text: str, speaker_id: int) -> bytes:
+        """音声クエリをJSONバイト列のまま取得"""
         try:
             params = {
                 'text': text,
@@ -72,27 +167,33 @@ class VOICEVOXClient:
             }
             
             response = await self.client.post(
-                f"{self.base_url}/audio_query",
+                "/audio_query",
                 params=params
             )
             response.raise_for_status()
             
-            return response.json()
+            return response.content
             
         except Exception as e:
             raise Exception(f"音声クエリ生成エラー: {str(e)}")
     
-    async def synthesis(self, audio_query: Dict, speaker_id: int) -> bytes:
-        """音声合成実行"""
+    async def synthesis(self, audio_query: Union[Dict, bytes], speaker_id: int) -> bytes:
+        """音声合成実行（audio_queryはdict、またはエンジンが返したJSONバイト列）"""
         try:
             params = {'speaker': speaker_id}
             headers = {'Content-Type': 'application/json'}
             
+            if isinstance(audio_query, bytes):
+                # パース・再シリアライズせずにそのまま送る
+                body = {'content': audio_query}
+            else:
+                body = {'json': audio_query}
+            
             response = await self.client.post(
-                f"{self.base_url}/synthesis",
+                "/synthesis",
                 params=params,
-                json=audio_query,
-                headers=headers
+                headers=headers,
+                **body
             )
             response.raise_for_status()
             
@@ -101,6 +202,39 @@ class VOICEVOXClient:
         except Exception as e:
             raise Exception(f"音声合成エラー: {str(e)}")
     
+    async def synthesis_to_file(
+        self,
+        audio_query: Union[Dict, bytes],
+        speaker_id: int,
+        file_path: str
+    ) -> str:
+        """音声合成の結果をメモリに溜めずにファイルへストリーミング保存"""
+        params = {'speaker': speaker_id}
+        headers = {'Content-Type': 'application/json'}
+        
+        if isinstance(audio_query, bytes):
+            body = {'content': audio_query}
+        else:
+            body = {'json': audio_query}
+        
+        try:
+            async with self.client.stream(
+                "POST", "/synthesis", params=params, headers=headers, **body
+            ) as response:
+                response.raise_for_status()
+                async with aiofiles.open(file_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(SYNTHESIS_CHUNK_SIZE):
+                        await f.write(chunk)
+            return file_path
+            
+        except Exception as e:
+            # 書きかけのファイルは残さない
+            try:
+                os.unlink(file_path)
+            except OSError:
+                pass
+            raise Exception(f"音声合成エラー: {str(e)}")
+    
     async def text_to_speech(
         self,
         text: str,
@@ -123,6 +257,48 @@ class VOICEVOXClient:
             pause_length: 文末などのポーズに追加する長さ（秒、0.0-3.0）
         """
 
+        audio_query = await self._prepare_query(
+            text, speaker_id, speed_scale, pitch_scale,
+            intonation_scale, volume_scale, pause_length
+        )
+        return await self.synthesis(audio_query, speaker_id)
+    
+    async def text_to_speech_file(
+        self,
+        text: str,
+        file_path: str,
+        speaker_id: int = 1,
+        speed_scale: float = 1.0,
+        pitch_scale: float = 0.0,
+        intonation_scale: float = 1.0,
+        volume_scale: float = 1.0,
+        pause_length: float = 0.0
+    ) -> str:
+        """テキストから音声を生成し、WAVファイルへ直接ストリーミング保存"""
+        audio_query = await self._prepare_query(
+            text, speaker_id, speed_scale, pitch_scale,
+            intonation_scale, volume_scale, pause_length
+        )
+        return await self.synthesis_to_file(audio_query, speaker_id, file_path)
+    
+    async def _prepare_query(
+        self,
+        text: str,
+        speaker_id: int,
+        speed_scale: float,
+        pitch_scale: float,
+        intonation_scale: float,
+        volume_scale: float,
+        pause_length: float
+    ) -> Union[Dict, bytes]:
+        """パラメータを反映した音声クエリを生成（調整なしならバイト列のまま）"""
+        # 調整なし（エンジンのクエリ既定値と同じ）ならクエリをバイト列のまま合成に渡す
+        if (
+            speed_scale == 1.0 and pitch_scale == 0.0 and intonation_scale == 1.0
+            and volume_scale == 1.0 and pause_length <= 0.0
+        ):
+            return await self._audio_query_raw(text, speaker_id)
+
         # 1. 音声クエリ生成
         audio_query = await self.audio_query(text, speaker_id)
 
@@ -141,8 +317,7 @@ class VOICEVOXClient:
                     original_length = pause_mora.get('vowel_length', 0.0)
                     pause_mora['vowel_length'] = original_length + pause_length
 
-        # 4. 音声合成
-        return await self.synthesis(audio_query, speaker_id)
+        return audio_query
     
     async def save_audio(
         self, 
@@ -171,29 +346,19 @@ class VOICEVOXClient:
         """よく使われる話者を推奨順で取得"""
         speakers = await self.get_speakers()
         
-        # 人気の話者を選定（ID順）
-        popular_speaker_ids = [
-            1,  # 四国めたん（ノーマル）
-            3,  # 春日部つむぎ（ノーマル）
-            2,  # ずんだもん（ノーマル）
-            20, # もち子さん（ノーマル）
-            8,  # 春日部つむぎ（ささやき）
-            10, # 雨晴はう（ノーマル）
-            14, # 冥鳴ひまり（ノーマル）
-            16, # No.7（ノーマル）
-        ]
-        
         popular_speakers = []
         for speaker in speakers:
             for style in speaker.get('styles', []):
-                if style.get('id') in popular_speaker_ids:
-                    popular_speakers.append({
-                        'speaker_name': speaker.get('name'),
-                        'style_name': style.get('name'),
-                        'style_id': style.get('id'),
-                        'speaker_uuid': speaker.get('speaker_uuid'),
-                        'order': popular_speaker_ids.index(style.get('id'))
-                    })
+                order = POPULAR_SPEAKER_ORDER.get(style.get('id'))
+                if order is None:
+                    continue
+                popular_speakers.append({
+                    'speaker_name': speaker.get('name'),
+                    'style_name': style.get('name'),
+                    'style_id': style.get('id'),
+                    'speaker_uuid': speaker.get('speaker_uuid'),
+                    'order': order
+                })
         
         # 推奨順でソート
         return sorted(popular_speakers, key=lambda x: x['order'])
@@ -204,45 +369,93 @@ class VOICEVOXClient:
         speaker_id: int = 1,
         **synthesis_params
     ) -> List[bytes]:
-        """複数テキストの一括音声合成"""
+        """複数テキストの一括音声合成（同時実行数はBATCH_SYNTHESIS_CONCURRENCYまで）"""
         
-        audio_results = []
+        semaphore = asyncio.Semaphore(BATCH_SYNTHESIS_CONCURRENCY)
         
-        for text in texts:
-            try:
-                audio_data = await self.text_to_speech(text, speaker_id, **synthesis_params)
-                audio_results.append(audio_data)
-            except Exception as e:
-                # エラーの場合は空のバイトデータを追加
-                print(f"音声合成エラー (テキスト: '{text}'): {str(e)}")
-                audio_results.append(b'')
+        async def synthesize_one(text: str) -> bytes:
+            async with semaphore:
+                try:
+                    return await self.text_to_speech(text, speaker_id, **synthesis_params)
+                except Exception as e:
+                    # エラーの場合は空のバイトデータを返す
+                    logger.warning(f"音声合成エラー (テキスト: '{text}'): {str(e)}")
+                    return b''
+        
+        # 結果は入力順に並ぶ
+        return list(await asyncio.gather(*(synthesize_one(text) for text in texts)))
+    
+    async def batch_synthesis_to_files(
+        self,
+        texts: List[str],
+        output_dir: str,
+        speaker_id: int = 1,
+        **synthesis_params
+    ) -> List[Optional[str]]:
+        """複数テキストを一括合成し、output_dir/speech_NNN.wav へ直接保存
+        
+        失敗したテキストの位置はNoneになる（入力順を維持）
+        """
+        
+        semaphore = asyncio.Semaphore(BATCH_SYNTHESIS_CONCURRENCY)
+        
+        async def synthesize_one(index: int, text: str) -> Optional[str]:
+            file_path = os.path.join(output_dir, f"speech_{index:03d}.wav")
+            async with semaphore:
+                try:
+                    return await self.text_to_speech_file(
+                        text, file_path, speaker_id, **synthesis_params
+                    )
+                except Exception as e:
+                    logger.warning(f"音声合成エラー (テキスト: '{text}'): {str(e)}")
+                    return None
         
-        return audio_results
+        return list(await asyncio.gather(
+            *(synthesize_one(i, text) for i, text in enumerate(texts))
+        ))
     
-    async def estimate_speech_time(self, text: str, speaker_id: int = 1) -> float:
-        """発話時間の推定（秒）"""
+    async def estimate_speech_time(
+        self,
+        text: str,
+        speaker_id: int = 1,
+        fast: bool = False
+    ) -> float:
+        """発話時間の推定（秒）
+        
+        audio_queryのモーラ長から計算し、結果は(speaker_id, text)単位で
+        キャッシュする。fast=Trueなら短いテキストはクエリせず文字数から推定する
+        """
+        if fast and len(text) < ESTIMATE_FAST_PATH_MAX_CHARS:
+            return len(text) / ESTIMATE_CHARS_PER_SECOND
+        
+        key = (speaker_id, text)
+        cached = _ESTIMATE_CACHE.get(key)
+        if cached is not None:
+            _ESTIMATE_CACHE.move_to_end(key)
+            return cached
+        
         try:
             audio_query = await self.audio_query(text, speaker_id)
-            
-            # accent_phrasesから発話時間を計算
-            total_time = 0.0
-            for accent_phrase in audio_query.get('accent_phrases', []):
-                for mora in accent_phrase.get('moras', []):
-                    total_time += mora.get('vowel_length', 0.0)
-                    consonant_length = mora.get('consonant_length')
-                    if consonant_length:
-                        total_time += consonant_length
-                
-                # ポーズ時間も追加
-                pause_mora = accent_phrase.get('pause_mora')
-                if pause_mora:
-                    total_time += pause_mora.get('vowel_length', 0.0)
-            
-            return total_time
-            
-        except Exception as e:
-            # エラー時は文字数ベースの推定（日本語: 約3文字/秒）
-            return len(text) / 3.0
+        except Exception:
+            # エラー時は文字数ベースの推定（キャッシュしない）
+            return len(text) / ESTIMATE_CHARS_PER_SECOND
+        
+        # accent_phrasesから発話時間を計算（ポーズ時間も含む）
+        total_time = 0.0
+        for accent_phrase in audio_query.get('accent_phrases', []):
+            total_time += sum(
+                mora.get('vowel_length', 0.0) + (mora.get('consonant_length') or 0.0)
+                for mora in accent_phrase.get('moras', [])
+            )
+            pause_mora = accent_phrase.get('pause_mora')
+            if pause_mora:
+                total_time += pause_mora.get('vowel_length', 0.0)
+        
+        _ESTIMATE_CACHE[key] = total_time
+        if len(_ESTIMATE_CACHE) > ESTIMATE_CACHE_MAX_ENTRIES:
+            _ESTIMATE_CACHE.popitem(last=False)
+        
+        return total_time
 
 
 # ユーティリティ関数
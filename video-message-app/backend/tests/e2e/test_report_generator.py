@@ -6,21 +6,69 @@ Date: 2025-11-07
 Purpose: Generate comprehensive test reports with metrics and statistics.
 """
 
+import asyncio
 import json
 import time
+from collections import Counter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from io import StringIO
 from typing import Dict, List, Any
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Indented JSON bytes (stdlib json when orjson is not installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _utc_iso(ts: float) -> str:
+    """Naive-UTC ISO 8601 string for an epoch timestamp"""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _success_rate(stats: Dict[str, int]) -> float:
+    """Success percentage of a category breakdown entry"""
+    return (stats["success"] / stats["total"] * 100) if stats["total"] > 0 else 0
+
 
 class TestReport:
     """Generate comprehensive test execution reports"""
 
+    # Initial capacity of the duration buffer (doubled when full)
+    DURATION_CAPACITY = 256
+
     def __init__(self):
         self.test_results: List[Dict[str, Any]] = []
         self.start_time = time.time()
         self.end_time = None
 
+        # Running aggregates, updated in add_result so summaries stay cheap
+        # even mid-run
+        self._success = 0
+        self._sum_ms = 0.0
+        self._min_ms = float("inf")
+        self._max_ms = float("-inf")
+        self._cat_total: Counter = Counter()
+        self._cat_success: Counter = Counter()
+        self._failed: List[Dict[str, Any]] = []
+
+        # Durations for percentiles; only the first _n entries are valid
+        self._durations = np.empty(self.DURATION_CAPACITY, dtype=np.float64)
+        self._n = 0
+
+        # Last generate_summary result; cleared whenever the report changes
+        self._summary_cache: Dict[str, Any] = None
+
     def add_result(
         self,
         test_name: str,
@@ -30,50 +78,82 @@ class TestReport:
         category: str = "e2e"
     ):
         """Add a test result"""
+        self._summary_cache = None
         self.test_results.append({
             "test_name": test_name,
             "success": success,
             "duration_ms": duration_ms,
             "error": error,
             "category": category,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": time.time()  # Epoch seconds; formatted on export
         })
 
+        self._sum_ms += duration_ms
+        if duration_ms < self._min_ms:
+            self._min_ms = duration_ms
+        if duration_ms > self._max_ms:
+            self._max_ms = duration_ms
+        self._cat_total[category] += 1
+        if success:
+            self._success += 1
+            self._cat_success[category] += 1
+        else:
+            self._failed.append({
+                "name": test_name,
+                "error": error,
+                "duration_ms": duration_ms
+            })
+
+        if self._n == self._durations.size:
+            grown = np.empty(self._durations.size * 2, dtype=np.float64)
+            grown[:self._n] = self._durations
+            self._durations = grown
+        self._durations[self._n] = duration_ms
+        self._n += 1
+
     def finalize(self):
         """Finalize report"""
         self.end_time = time.time()
+        self._summary_cache = None
 
     def generate_summary(self) -> Dict[str, Any]:
-        """Generate test execution summary"""
+        """Generate test execution summary (cached until the report changes; do not mutate)"""
         if not self.end_time:
             self.finalize()
+        if self._summary_cache is not None:
+            return self._summary_cache
 
-        total_tests = len(self.test_results)
-        successful = sum(1 for r in self.test_results if r["success"])
+        total_tests = self._n
+        successful = self._success
         failed = total_tests - successful
 
         success_rate = (successful / total_tests * 100) if total_tests > 0 else 0
 
-        # Calculate latency stats
-        durations = [r["duration_ms"] for r in self.test_results]
-        avg_latency = sum(durations) / len(durations) if durations else 0
-        p50_latency = sorted(durations)[len(durations) // 2] if durations else 0
-        p95_latency = sorted(durations)[int(len(durations) * 0.95)] if durations else 0
-        p99_latency = sorted(durations)[int(len(durations) * 0.99)] if durations else 0
+        # Calculate latency stats from the running aggregates; only the
+        # percentiles need the durations themselves. Nearest-rank indices
+        # are selected in one introselect pass (np.partition), no full sort.
+        if total_tests:
+            kth = [int(total_tests * q) for q in (0.50, 0.95, 0.99)]
+            selected = np.partition(self._durations[:total_tests], kth)
+            p50_latency, p95_latency, p99_latency = (float(selected[k]) for k in kth)
+            avg_latency = self._sum_ms / total_tests
+            min_latency = self._min_ms
+            max_latency = self._max_ms
+        else:
+            avg_latency = p50_latency = p95_latency = p99_latency = 0
+            min_latency = max_latency = 0
 
         # Category breakdown
-        categories = {}
-        for result in self.test_results:
-            cat = result["category"]
-            if cat not in categories:
-                categories[cat] = {"total": 0, "success": 0, "failed": 0}
-            categories[cat]["total"] += 1
-            if result["success"]:
-                categories[cat]["success"] += 1
-            else:
-                categories[cat]["failed"] += 1
-
-        return {
+        categories = {
+            cat: {
+                "total": total,
+                "success": self._cat_success[cat],
+                "failed": total - self._cat_success[cat]
+            }
+            for cat, total in self._cat_total.items()
+        }
+
+        self._summary_cache = {
             "summary": {
                 "total_tests": total_tests,
                 "successful": successful,
@@ -86,88 +166,113 @@ class TestReport:
                 "p50_ms": p50_latency,
                 "p95_ms": p95_latency,
                 "p99_ms": p99_latency,
-                "min_ms": min(durations) if durations else 0,
-                "max_ms": max(durations) if durations else 0
+                "min_ms": min_latency,
+                "max_ms": max_latency
             },
             "categories": categories,
-            "failed_tests": [
-                {
-                    "name": r["test_name"],
-                    "error": r["error"],
-                    "duration_ms": r["duration_ms"]
-                }
-                for r in self.test_results if not r["success"]
-            ]
+            "failed_tests": list(self._failed)
         }
+        return self._summary_cache
 
     def export_json(self, output_path: Path):
         """Export report as JSON"""
-        summary = self.generate_summary()
-        summary["results"] = self.test_results
+        # Copy before adding results so the cached summary stays untouched
+        summary = dict(self.generate_summary())
+        summary["results"] = [
+            {**r, "timestamp": _utc_iso(r["timestamp"])} for r in self.test_results
+        ]
 
-        with open(output_path, "w") as f:
-            json.dump(summary, f, indent=2)
+        Path(output_path).write_bytes(_json_dumps(summary))
 
     def export_markdown(self, output_path: Path):
         """Export report as Markdown"""
         summary = self.generate_summary()
+        generated = _utc_iso(time.time())
+        totals = summary["summary"]
+        latency = summary["latency"]
+
+        buf = StringIO()
+        buf.write(f"""# E2E Test Report
+
+**Generated**: {generated}Z
 
-        md = []
-        md.append("# E2E Test Report")
-        md.append("")
-        md.append(f"**Generated**: {datetime.utcnow().isoformat()}Z")
-        md.append("")
-
-        # Summary
-        md.append("## Summary")
-        md.append("")
-        md.append(f"- **Total Tests**: {summary['summary']['total_tests']}")
-        md.append(f"- **Successful**: {summary['summary']['successful']}")
-        md.append(f"- **Failed**: {summary['summary']['failed']}")
-        md.append(f"- **Success Rate**: {summary['summary']['success_rate']}")
-        md.append(f"- **Total Duration**: {summary['summary']['total_duration_s']:.2f}s")
-        md.append("")
-
-        # Latency
-        md.append("## Latency Metrics")
-        md.append("")
-        md.append("| Metric | Value (ms) |")
-        md.append("|--------|------------|")
-        md.append(f"| Average | {summary['latency']['average_ms']:.2f} |")
-        md.append(f"| P50 | {summary['latency']['p50_ms']:.2f} |")
-        md.append(f"| P95 | {summary['latency']['p95_ms']:.2f} |")
-        md.append(f"| P99 | {summary['latency']['p99_ms']:.2f} |")
-        md.append(f"| Min | {summary['latency']['min_ms']:.2f} |")
-        md.append(f"| Max | {summary['latency']['max_ms']:.2f} |")
-        md.append("")
-
-        # Categories
-        md.append("## Test Categories")
-        md.append("")
-        md.append("| Category | Total | Success | Failed | Success Rate |")
-        md.append("|----------|-------|---------|--------|--------------|")
+## Summary
+
+- **Total Tests**: {totals['total_tests']}
+- **Successful**: {totals['successful']}
+- **Failed**: {totals['failed']}
+- **Success Rate**: {totals['success_rate']}
+- **Total Duration**: {totals['total_duration_s']:.2f}s
+
+## Latency Metrics
+
+| Metric | Value (ms) |
+|--------|------------|
+| Average | {latency['average_ms']:.2f} |
+| P50 | {latency['p50_ms']:.2f} |
+| P95 | {latency['p95_ms']:.2f} |
+| P99 | {latency['p99_ms']:.2f} |
+| Min | {latency['min_ms']:.2f} |
+| Max | {latency['max_ms']:.2f} |
+
+## Test Categories
+
+| Category | Total | Success | Failed | Success Rate |
+|----------|-------|---------|--------|--------------|
+""")
         for cat, stats in summary["categories"].items():
-            rate = (stats["success"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            md.append(f"| {cat} | {stats['total']} | {stats['success']} | {stats['failed']} | {rate:.1f}% |")
-        md.append("")
+            buf.write(
+                f"| {cat} | {stats['total']} | {stats['success']} | {stats['failed']} "
+                f"| {_success_rate(stats):.1f}% |\n"
+            )
 
         # Failed tests
         if summary["failed_tests"]:
-            md.append("## Failed Tests")
-            md.append("")
+            buf.write("\n## Failed Tests\n")
             for test in summary["failed_tests"]:
-                md.append(f"### {test['name']}")
-                md.append(f"- **Error**: {test['error']}")
-                md.append(f"- **Duration**: {test['duration_ms']:.2f}ms")
-                md.append("")
+                buf.write(
+                    f"\n### {test['name']}\n"
+                    f"- **Error**: {test['error']}\n"
+                    f"- **Duration**: {test['duration_ms']:.2f}ms\n"
+                )
 
-        with open(output_path, "w") as f:
-            f.write("\n".join(md))
+        Path(output_path).write_text(buf.getvalue())
 
     def export_html(self, output_path: Path):
         """Export report as HTML"""
         summary = self.generate_summary()
 
+        generated = _utc_iso(time.time())
+
+        # Pre-render the repeated rows, then fill the page template once
+        cat_rows = "".join(
+            f"""
+            <tr>
+                <td>{cat}</td>
+                <td>{stats['total']}</td>
+                <td class="success">{stats['success']}</td>
+                <td class="failed">{stats['failed']}</td>
+                <td>{_success_rate(stats):.1f}%</td>
+            </tr>
+"""
+            for cat, stats in summary["categories"].items()
+        )
+
+        failed_section = ""
+        if summary["failed_tests"]:
+            failed_section = """
+        <h2>Failed Tests</h2>
+""" + "".join(
+                f"""
+        <div class="error-box">
+            <strong>{test['name']}</strong><br>
+            <strong>Error:</strong> {test['error']}<br>
+            <strong>Duration:</strong> {test['duration_ms']:.2f}ms
+        </div>
+"""
+                for test in summary["failed_tests"]
+            )
+
         html = f"""
 <!DOCTYPE html>
 <html>
@@ -258,7 +363,7 @@ class TestReport:
 <body>
     <div class="container">
         <h1>E2E Test Report</h1>
-        <p class="timestamp">Generated: {datetime.utcnow().isoformat()}Z</p>
+        <p class="timestamp">Generated: {generated}Z</p>
 
         <h2>Summary</h2>
         <div class="summary">
@@ -325,48 +430,18 @@ class TestReport:
                 <th>Failed</th>
                 <th>Success Rate</th>
             </tr>
-"""
-
-        for cat, stats in summary["categories"].items():
-            rate = (stats["success"] / stats["total"] * 100) if stats["total"] > 0 else 0
-            html += f"""
-            <tr>
-                <td>{cat}</td>
-                <td>{stats['total']}</td>
-                <td class="success">{stats['success']}</td>
-                <td class="failed">{stats['failed']}</td>
-                <td>{rate:.1f}%</td>
-            </tr>
-"""
-
-        html += """
+{cat_rows}
         </table>
-"""
-
-        if summary["failed_tests"]:
-            html += """
-        <h2>Failed Tests</h2>
-"""
-            for test in summary["failed_tests"]:
-                html += f"""
-        <div class="error-box">
-            <strong>{test['name']}</strong><br>
-            <strong>Error:</strong> {test['error']}<br>
-            <strong>Duration:</strong> {test['duration_ms']:.2f}ms
-        </div>
-"""
-
-        html += """
+{failed_section}
     </div>
 </body>
 </html>
 """
 
-        with open(output_path, "w") as f:
-            f.write(html)
+        Path(output_path).write_text(html)
 
 
-if __name__ == "__main__":
+async def main():
     # Example usage
     report = TestReport()
 
@@ -378,15 +453,21 @@ if __name__ == "__main__":
     report.add_result("test_xss_attack", True, 98.7, category="security")
     report.add_result("test_audio_bomb", False, 5123.2, "Security violation", category="security")
 
-    # Export reports
+    # Export reports (independent blocking writes, run concurrently in threads)
     output_dir = Path(__file__).parent.parent.parent / "test_reports"
     output_dir.mkdir(exist_ok=True)
 
-    report.export_json(output_dir / "test_report.json")
-    report.export_markdown(output_dir / "test_report.md")
-    report.export_html(output_dir / "test_report.html")
+    await asyncio.gather(
+        asyncio.to_thread(report.export_json, output_dir / "test_report.json"),
+        asyncio.to_thread(report.export_markdown, output_dir / "test_report.md"),
+        asyncio.to_thread(report.export_html, output_dir / "test_report.html"),
+    )
 
     print("✅ Test reports generated:")
     print(f"   - {output_dir / 'test_report.json'}")
     print(f"   - {output_dir / 'test_report.md'}")
     print(f"   - {output_dir / 'test_report.html'}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
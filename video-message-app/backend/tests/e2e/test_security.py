@@ -25,6 +25,7 @@ import time
 from pathlib import Path
 import tempfile
 import os
+import struct
 
 # Import services
 from backend.services.voice_pipeline_unified import VoicePipelineUnified, get_voice_pipeline
@@ -36,7 +37,28 @@ from backend.security.file_validator import FileValidator, SecurityViolation
 # Fixtures - Malicious Test Data
 # ============================================================================
 
-@pytest.fixture
+# RIFF/WAVE header with a 16-byte PCM fmt chunk, followed by the data chunk header
+WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def wav_header(riff_size: int, sample_rate: int, byte_rate: int, data_size: int) -> bytes:
+    """Mono 16-bit PCM WAV header with arbitrary (possibly bogus) size fields"""
+    return WAV_HEADER.pack(
+        b"RIFF", riff_size, b"WAVE",
+        b"fmt ", 16,
+        1,  # PCM
+        1,  # Mono
+        sample_rate,
+        byte_rate,
+        2,  # Block align
+        16,  # 16-bit
+        b"data", data_size
+    )
+
+
+# Attack inputs are read-only, so each fixture builds them once per session
+
+@pytest.fixture(scope="session")
 def malicious_texts():
     """
     ...これらは攻撃パターンです。
@@ -56,29 +78,22 @@ def malicious_texts():
     }
 
 
-@pytest.fixture
-def malicious_audio_files(tmp_path):
+@pytest.fixture(scope="session")
+def malicious_audio_files(tmp_path_factory):
     """
     ...音声ボム攻撃のテストケースです。
     """
+    tmp_path = tmp_path_factory.mktemp("malicious_audio")
     files = {}
 
     # 1. Oversized WAV header (claims 4GB data)
     audio_bomb_1 = tmp_path / "audio_bomb_oversized.wav"
-    with open(audio_bomb_1, "wb") as f:
-        f.write(b"RIFF")
-        f.write((2**32 - 1).to_bytes(4, "little"))  # Max file size
-        f.write(b"WAVE")
-        f.write(b"fmt ")
-        f.write((16).to_bytes(4, "little"))
-        f.write((1).to_bytes(2, "little"))  # PCM
-        f.write((1).to_bytes(2, "little"))  # Mono
-        f.write((16000).to_bytes(4, "little"))  # 16kHz
-        f.write((32000).to_bytes(4, "little"))  # Byte rate
-        f.write((2).to_bytes(2, "little"))  # Block align
-        f.write((16).to_bytes(2, "little"))  # 16-bit
-        f.write(b"data")
-        f.write((2**32 - 100).to_bytes(4, "little"))  # Huge data chunk
+    audio_bomb_1.write_bytes(wav_header(
+        riff_size=2**32 - 1,  # Max file size
+        sample_rate=16000,  # 16kHz
+        byte_rate=32000,
+        data_size=2**32 - 100  # Huge data chunk
+    ))
 
     files["oversized_header"] = audio_bomb_1
 
@@ -99,33 +114,27 @@ def malicious_audio_files(tmp_path):
 
     # 5. Extremely high sample rate (999MHz)
     high_rate = tmp_path / "high_rate.wav"
-    with open(high_rate, "wb") as f:
-        f.write(b"RIFF")
-        f.write((36).to_bytes(4, "little"))
-        f.write(b"WAVE")
-        f.write(b"fmt ")
-        f.write((16).to_bytes(4, "little"))
-        f.write((1).to_bytes(2, "little"))
-        f.write((1).to_bytes(2, "little"))
-        f.write((999_000_000).to_bytes(4, "little"))  # 999MHz (impossible)
-        f.write((1998_000_000).to_bytes(4, "little"))
-        f.write((2).to_bytes(2, "little"))
-        f.write((16).to_bytes(2, "little"))
-        f.write(b"data")
-        f.write((0).to_bytes(4, "little"))
+    high_rate.write_bytes(wav_header(
+        riff_size=36,
+        sample_rate=999_000_000,  # 999MHz (impossible)
+        byte_rate=1998_000_000,
+        data_size=0
+    ))
     files["high_rate"] = high_rate
 
     return files
 
 
-@pytest.fixture
-def malicious_images(tmp_path):
+@pytest.fixture(scope="session")
+def malicious_images(tmp_path_factory):
     """
     ...画像ボム攻撃のテストケースです。
     """
     import cv2
     import numpy as np
 
+    tmp_path = tmp_path_factory.mktemp("malicious_images")
+
     files = {}
 
     # 1. Extremely large image (claims 100000x100000 pixels)
@@ -495,10 +504,11 @@ class TestResourceExhaustion:
         )
         await storage_manager.start()
 
-        # Create many files
+        # Create many files (one shared 10KB payload)
+        payload = b"x" * 10_000
         for i in range(100):
             test_file = tmp_path / f"test_{i}.dat"
-            test_file.write_bytes(b"x" * 10_000)  # 10KB each
+            test_file.write_bytes(payload)
 
             try:
                 await storage_manager.store_file(
@@ -623,10 +633,10 @@ class TestFileUploadSecurity:
         """
         validator = FileValidator()
 
-        # Create 100MB file
+        # Create 100MB file (sparse: only the reported size matters)
         large_file = tmp_path / "large.wav"
-        with open(large_file, "wb") as f:
-            f.write(b"\x00" * 100_000_000)  # 100MB
+        large_file.touch()
+        os.truncate(large_file, 100_000_000)  # 100MB
 
         # Should be rejected
         with pytest.raises(SecurityViolation, match="size|limit|too large"):
@@ -87,6 +87,91 @@ async def test_publish_multiple_events(tracker):
         assert event.data["progress"] == i * 20
 
 
+@pytest.mark.asyncio
+async def test_publish_events_batch(tracker):
+    """Test publishing a batch of events in one call"""
+    task_id = "test-task-batch"
+
+    await tracker.publish_events_batch(
+        task_id,
+        [(EventType.PROGRESS_UPDATE, {"progress": i * 25}) for i in range(5)]
+    )
+
+    # Batch keeps publish order in history
+    history = tracker.get_progress_history(task_id)
+    assert [event.data["progress"] for event in history] == [0, 25, 50, 75, 100]
+    assert all(event.task_id == task_id for event in history)
+
+
+@pytest.mark.asyncio
+async def test_publish_event_nowait_and_drain(tracker):
+    """Test fire-and-forget publishing followed by a single drain barrier"""
+    task_id = "test-task-nowait"
+    received = []
+
+    async def subscriber():
+        async for event in tracker.subscribe(task_id):
+            received.append(event.data["progress"])
+            if len(received) >= 10:
+                break
+
+    subscriber_task = asyncio.create_task(subscriber())
+    await asyncio.sleep(0.1)
+
+    for i in range(10):
+        tracker.publish_event_nowait(task_id, EventType.PROGRESS_UPDATE, {"progress": i})
+
+    # History is updated synchronously
+    assert len(tracker.get_progress_history(task_id)) == 10
+
+    await asyncio.wait_for(tracker.drain(task_id), timeout=1.0)
+    assert received == list(range(10))
+
+    await subscriber_task
+
+
+@pytest.mark.asyncio
+async def test_subscribe_batches_coalesces_events(tracker):
+    """Test that events queued before a subscriber wakes arrive as one batch"""
+    task_id = "test-task-batches"
+    batches = []
+    ready = asyncio.Event()
+    first_batch = asyncio.Event()
+
+    async def subscriber():
+        async for batch in tracker.subscribe_batches(task_id, ready=ready):
+            batches.append([event.data["progress"] for event in batch])
+            first_batch.set()
+            if sum(len(b) for b in batches) >= 6:
+                break
+
+    subscriber_task = asyncio.create_task(subscriber())
+    await ready.wait()
+
+    for i in range(5):
+        tracker.publish_event_nowait(task_id, EventType.PROGRESS_UPDATE, {"progress": i})
+    await asyncio.wait_for(first_batch.wait(), timeout=1.0)
+    await tracker.publish_event(task_id, EventType.PROGRESS_UPDATE, {"progress": 5})
+
+    await asyncio.wait_for(subscriber_task, timeout=1.0)
+    assert batches == [[0, 1, 2, 3, 4], [5]]
+    await asyncio.wait_for(tracker.drain(task_id), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_history_is_capped():
+    """Test that per-task history keeps only the newest history_cap events"""
+    tracker = ProgressTracker(retention_minutes=1, history_cap=3)
+    task_id = "test-task-capped"
+
+    for i in range(5):
+        await tracker.publish_event(task_id, EventType.PROGRESS_UPDATE, {"progress": i})
+
+    history = tracker.get_progress_history(task_id)
+    assert [event.data["progress"] for event in history] == [2, 3, 4]
+    assert tracker.get_latest_progress(task_id).data["progress"] == 4
+
+
 @pytest.mark.asyncio
 async def test_get_latest_progress(tracker):
     """Test getting latest progress"""
@@ -279,6 +364,30 @@ async def test_automatic_cleanup(started_tracker):
     assert len(history_after) == 0
 
 
+@pytest.mark.asyncio
+async def test_leased_subscriber_is_pooled(tracker):
+    """Test that released subscriber queues are reused by the next lease"""
+    task_id = "test-task-lease"
+
+    lease = await tracker.lease_subscriber(task_id)
+    assert tracker.get_subscriber_count(task_id) == 1
+
+    await tracker.publish_event(task_id, EventType.PROGRESS_UPDATE, {"progress": 10})
+    event = await asyncio.wait_for(lease.get(), timeout=1.0)
+    assert event.data["progress"] == 10
+
+    # Unread events are discarded on release
+    await tracker.publish_event(task_id, EventType.PROGRESS_UPDATE, {"progress": 20})
+    await tracker.release_subscriber(lease)
+    assert tracker.get_subscriber_count(task_id) == 0
+    await asyncio.wait_for(tracker.drain(task_id), timeout=1.0)
+
+    second = await tracker.lease_subscriber(task_id)
+    assert second.queue is lease.queue
+    assert second.queue.empty()
+    await tracker.release_subscriber(second)
+
+
 @pytest.mark.asyncio
 async def test_active_task_tracking(tracker):
     """Test active task tracking"""
@@ -357,6 +466,31 @@ async def test_subscriber_queue_full_handling(tracker):
     assert len(received_events) >= 2
 
 
+@pytest.mark.asyncio
+async def test_full_queue_disconnects_subscriber(tracker):
+    """Test that a full subscriber queue disconnects the subscriber instead of dropping events"""
+    task_id = "test-task-overflow"
+    received = []
+
+    async def subscriber():
+        async for event in tracker.subscribe(task_id, queue_size=2):
+            received.append(event.data["progress"])
+
+    subscriber_task = asyncio.create_task(subscriber())
+    await asyncio.sleep(0.1)
+
+    # Publish without yielding so the queue overflows before the subscriber runs
+    for i in range(5):
+        tracker.publish_event_nowait(task_id, EventType.PROGRESS_UPDATE, {"progress": i})
+
+    assert tracker.get_subscriber_count(task_id) == 0
+
+    # The subscriber receives what was queued, then its stream ends
+    await asyncio.wait_for(subscriber_task, timeout=1.0)
+    assert received == [0, 1]
+    await asyncio.wait_for(tracker.drain(task_id), timeout=1.0)
+
+
 @pytest.mark.asyncio
 async def test_nonexistent_task(tracker):
     """Test querying non-existent task"""
@@ -400,6 +534,29 @@ def test_event_to_sse():
     assert sse_str.endswith("\n\n")
 
 
+@pytest.mark.asyncio
+async def test_publish_event_preencoded(tracker):
+    """Test that a pre-encoded payload serializes like a regular event"""
+    task_id = "test-task-preencoded"
+
+    await tracker.publish_event_preencoded(
+        task_id,
+        EventType.PROGRESS_UPDATE,
+        b'{"progress": 42, "stage": "encode"}'
+    )
+
+    event = tracker.get_latest_progress(task_id)
+    assert event.data == {"progress": 42, "stage": "encode"}
+
+    expected = ProgressEvent(
+        task_id=task_id,
+        event_type=EventType.PROGRESS_UPDATE,
+        data={"progress": 42, "stage": "encode"},
+        created_at=event.created_at
+    )
+    assert event.to_json() == expected.to_json()
+
+
 # ============================================================================
 # Performance Benchmarks
 # ============================================================================
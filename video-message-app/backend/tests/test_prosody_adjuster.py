@@ -15,10 +15,12 @@ from services.prosody_adjuster import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_data():
     """
     テスト用サンプル音声データ生成（1秒のサイン波）
+
+    bytesは不変なので、セッション中に一度だけ生成して共有する
     """
     sample_rate = 24000
     duration = 1.0  # 1秒
@@ -118,6 +120,13 @@ class TestProsodyAdjuster:
         assert abs(result.duration_original - result.duration_adjusted) < 0.1  # ほぼ同じ長さ
         assert len(result.adjustments_applied) == 0  # 調整なし
 
+    def test_no_adjustment_returns_input_unchanged(self, adjuster, sample_audio_data):
+        """調整なし・出力形式と同じ入力はそのまま返されるかのテスト"""
+        result = adjuster.adjust_prosody(sample_audio_data, ProsodyConfig())
+
+        assert result.success is True
+        assert result.audio_data == sample_audio_data
+
     def test_pitch_shift_positive(self, adjuster, sample_audio_data):
         """正のピッチシフトのテスト"""
         config = ProsodyConfig(pitch_shift=3.0)  # +3 semitones
@@ -222,6 +231,17 @@ class TestProsodyAdjuster:
         assert result.success is False
         assert result.error_message is not None
 
+    def test_adjust_prosody_samples_matches_bytes(self, adjuster, sample_audio_data):
+        """デコード済みサンプルへの調整がバイト列入力と同じ結果になるかのテスト"""
+        config = ProsodyConfig(volume_db=-3.0)
+        audio, sr = sf.read(io.BytesIO(sample_audio_data))
+
+        result_bytes = adjuster.adjust_prosody(sample_audio_data, config)
+        result_samples = adjuster.adjust_prosody_samples(audio, sr, config)
+
+        assert result_samples.success is True
+        assert result_samples.audio_data == result_bytes.audio_data
+
 
 class TestEdgeCases:
     """エッジケースのテスト"""